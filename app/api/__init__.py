@@ -1,7 +1,9 @@
 """FastAPI endpoints for video generation.
 
 REST API module providing:
-- POST /api/v1/generate: Generate video from text
+- POST /api/v1/generate: Enqueue video generation from text (Celery)
+- GET /api/v1/generate/stream: Generate video, streaming progress (SSE)
+- GET /api/v1/task/{task_id}: Poll video generation task status
 - GET /api/v1/video/{filename}: Download generated video
 - GET /api/v1/health: Health check
 
@@ -1,87 +1,356 @@
 """FastAPI endpoints for video generation API."""
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import stat
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import Annotated
 
+from celery.result import AsyncResult
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+from app.api.rate_limit import limiter
 from app.core.config import get_settings
-from app.services.video_generator import generate_video_from_text
+from app.tasks import celery_app, generate_video_task, render_video
 
 router = APIRouter(prefix="/api/v1", tags=["video"])
+logger = logging.getLogger(__name__)
+
+# Bounds in-process generations (ffmpeg/PIL) when the task queue is disabled
+_generation_semaphore = asyncio.Semaphore(get_settings().max_concurrent_generations)
+_queued_generations = 0
+# Strong references to streamed renders, which outlive their client on disconnect
+_background_tasks: set[asyncio.Task[Path]] = set()
+
+VIDEO_CHUNK_SIZE = 4 * 1024 * 1024  # 4 MiB
+VIDEO_CACHE_CONTROL = "public, max-age=31536000, immutable"  # URLs are content hashes
+
+
+class VideoFileResponse(FileResponse):
+    """
+    FileResponse that streams video in large bounded chunks.
+
+    Starlette already handles Range requests (206 + Content-Range) and uses
+    the zero-copy `http.response.pathsend` extension when the server offers it.
+    """
+
+    chunk_size = VIDEO_CHUNK_SIZE
 
 
-class VideoGenerationRequest(BaseModel):
+# Request/response models are pydantic dataclasses rather than BaseModel:
+# validated by the same pydantic-core schema without the BaseModel
+# machinery. Constraints live in Annotated so they also apply when the
+# request is read from query parameters via Depends().
+
+
+@dataclass(frozen=True, slots=True)
+class VideoGenerationRequest:
     """Request model for video generation."""
 
-    input_text: str = Field(..., description="Input text to convert to video")
-    use_mock_llm: bool = Field(default=True, description="Use mock LLM provider")
-    width: int = Field(default=1920, ge=640, le=3840, description="Video width")
-    height: int = Field(default=1080, ge=360, le=2160, description="Video height")
+    input_text: Annotated[str, Field(description="Input text to convert to video")]
+    use_mock_llm: Annotated[bool, Field(description="Use mock LLM provider")] = True
+    width: Annotated[int, Field(ge=640, le=3840, description="Video width")] = 1920
+    height: Annotated[int, Field(ge=360, le=2160, description="Video height")] = 1080
 
 
-class VideoGenerationResponse(BaseModel):
+@dataclass(slots=True)
+class VideoGenerationResponse:
     """Response model for video generation."""
 
     message: str
+    status: Annotated[str, Field(description="Status: 'processing', 'completed' or 'failed'")]
     video_path: str | None = None
-    status: str = Field(..., description="Status: 'processing' or 'completed'")
+    task_id: str | None = None
 
 
-@router.post("/generate", response_model=VideoGenerationResponse)
-async def generate_video(
-    request: VideoGenerationRequest,
-    background_tasks: BackgroundTasks,
-) -> VideoGenerationResponse:
+def _output_path_for(request: VideoGenerationRequest) -> Path:
+    """Get the deterministic output path: identical requests map to the same video."""
+    key = hashlib.blake2b(
+        f"{request.width}x{request.height}|{request.use_mock_llm}|{request.input_text}".encode(),
+        digest_size=12,
+    ).hexdigest()
+    return get_settings().output_directory / f"video_{key}.mp4"
+
+
+def _video_etag(stat_result: os.stat_result) -> str:
+    """Build a strong ETag from the file size and modification time."""
+    return f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header (a list of ETags or "*") against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _check_generation_capacity() -> None:
     """
-    Generate video from input text.
+    Reject with 503 once too many in-process generations are waiting for a slot.
 
-    Note: Video generation is CPU-intensive and may take time.
-    Consider implementing async task queue (e.g., Celery) for production.
+    Fails fast instead of queueing indefinitely.
     """
-    settings = get_settings()
-    output_path = settings.output_directory / f"video_{id(request)}.mp4"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if (
+        _generation_semaphore.locked()
+        and _queued_generations >= get_settings().max_queued_generations
+    ):
+        raise HTTPException(
+            status_code=503,
+            detail="Too many video generations in progress",
+            headers={"Retry-After": "30"},
+        )
+
+
+async def _render_in_process(
+    request: VideoGenerationRequest,
+    output_path: Path,
+    progress_callback: Callable[[str, float], None] | None = None,
+) -> Path:
+    """Render video in a worker thread, bounded by the generation semaphore."""
+    global _queued_generations
+
+    _check_generation_capacity()
+
+    _queued_generations += 1
+    try:
+        await _generation_semaphore.acquire()
+    finally:
+        _queued_generations -= 1
 
     try:
-        video_path = generate_video_from_text(
+        return await asyncio.to_thread(
+            render_video,
             input_text=request.input_text,
             output_path=output_path,
             use_mock_llm=request.use_mock_llm,
             width=request.width,
             height=request.height,
+            progress_callback=progress_callback,
+        )
+    finally:
+        _generation_semaphore.release()
+
+
+def _log_abandoned_render(task: asyncio.Task[Path]) -> None:
+    """Report the outcome of a render whose stream client has gone away."""
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.error("Video render failed after the client disconnected", exc_info=exc)
+
+
+def _sse_event(data: dict) -> str:
+    """Format a Server-Sent Event carrying JSON data."""
+    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _generation_events(
+    request: VideoGenerationRequest, output_path: Path
+) -> AsyncIterator[str]:
+    """Render video in-process and yield SSE progress events as stages complete."""
+    if output_path.exists():
+        yield _sse_event({"status": "completed", "video_path": str(output_path)})
+        return
+
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue[dict | None] = asyncio.Queue()
+
+    def on_progress(stage: str, progress: float) -> None:
+        # Called from the worker thread
+        loop.call_soon_threadsafe(
+            events.put_nowait, {"status": "processing", "stage": stage, "progress": progress}
         )
 
+    task = asyncio.create_task(_render_in_process(request, output_path, on_progress))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    task.add_done_callback(lambda _: events.put_nowait(None))
+
+    try:
+        while (event := await events.get()) is not None:
+            yield _sse_event(event)
+    finally:
+        if not task.done():
+            # Client disconnected: the render thread cannot be interrupted, so
+            # let it finish (the video is reusable) and surface any failure
+            task.add_done_callback(_log_abandoned_render)
+
+    try:
+        video_path = task.result()
+    except HTTPException as e:
+        yield _sse_event({"status": "failed", "message": e.detail})
+    except Exception as e:
+        yield _sse_event({"status": "failed", "message": f"Video generation failed: {e}"})
+    else:
+        yield _sse_event({"status": "completed", "video_path": str(video_path)})
+
+
+@router.post("/generate", response_model=VideoGenerationResponse)
+@limiter.shared_limit(lambda: get_settings().generate_rate_limit, scope="generate")
+async def generate_video(
+    request: Request, payload: VideoGenerationRequest
+) -> VideoGenerationResponse:
+    """
+    Generate video from input text.
+
+    Video generation is CPU-intensive, so it runs in a Celery worker.
+    Poll /task/{task_id} for the result. Requests identical to an already
+    generated video return it immediately.
+
+    With use_task_queue disabled, the video is rendered in a worker thread of
+    this process instead, so the event loop keeps serving other requests.
+
+    Rate limited per client (settings.generate_rate_limit).
+    """
+    settings = get_settings()
+    output_path = _output_path_for(payload)
+
+    if output_path.exists():
+        return VideoGenerationResponse(
+            message="Video already generated",
+            video_path=str(output_path),
+            status="completed",
+        )
+
+    if not settings.use_task_queue:
+        try:
+            video_path = await _render_in_process(payload, output_path)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Video generation failed: {str(e)}")
+
         return VideoGenerationResponse(
             message="Video generated successfully",
             video_path=str(video_path),
             status="completed",
         )
 
+    try:
+        task = generate_video_task.apply_async(
+            kwargs={
+                "input_text": payload.input_text,
+                "output_path": str(output_path),
+                "use_mock_llm": payload.use_mock_llm,
+                "width": payload.width,
+                "height": payload.height,
+            }
+        )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Video generation failed: {str(e)}")
+        raise HTTPException(status_code=503, detail=f"Failed to enqueue video generation: {str(e)}")
+
+    return VideoGenerationResponse(
+        message="Video generation started",
+        task_id=task.id,
+        status="processing",
+    )
+
+
+@router.get("/generate/stream")
+@limiter.shared_limit(lambda: get_settings().generate_rate_limit, scope="generate")
+async def generate_video_stream(
+    request: Request,
+    payload: Annotated[VideoGenerationRequest, Depends()],
+) -> StreamingResponse:
+    """
+    Generate video from input text, streaming progress as Server-Sent Events.
+
+    Each pipeline stage (script, assets, compose) emits a progress event as it
+    completes; the final event carries the video path or the failure message.
+    Rendering always runs in this process, bounded like in-process /generate,
+    and shares the /generate rate limit.
+    """
+    output_path = _output_path_for(payload)
+    if not output_path.exists():
+        _check_generation_capacity()
+
+    return StreamingResponse(
+        _generation_events(payload, output_path),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.get("/task/{task_id}", response_model=VideoGenerationResponse)
+def get_task_status(task_id: str) -> VideoGenerationResponse:
+    """
+    Get status of a video generation task.
+
+    Note: Declared sync so result backend lookups run in the threadpool.
+
+    Args:
+        task_id: Task ID returned by /generate
+
+    Returns:
+        Task status, with the video path once completed
+    """
+    result = AsyncResult(task_id, app=celery_app)
+
+    if result.successful():
+        return VideoGenerationResponse(
+            message="Video generated successfully",
+            video_path=result.result,
+            task_id=task_id,
+            status="completed",
+        )
+    if result.failed():
+        return VideoGenerationResponse(
+            message=f"Video generation failed: {result.result}",
+            task_id=task_id,
+            status="failed",
+        )
+    return VideoGenerationResponse(
+        message="Video generation in progress",
+        task_id=task_id,
+        status="processing",
+    )
 
 
 @router.get("/video/{video_filename}")
-async def get_video(video_filename: str) -> FileResponse:
+@limiter.limit(lambda: get_settings().video_rate_limit)
+async def get_video(request: Request, video_filename: str) -> Response:
     """
     Retrieve generated video file.
 
+    Supports HTTP Range requests so players can seek without re-downloading,
+    and conditional requests: a matching If-None-Match gets an empty 304.
+    Rate limited per client (settings.video_rate_limit).
+
     Args:
+        request: Incoming request (used for rate limiting)
         video_filename: Name of the video file
 
     Returns:
-        Video file response
+        Video file response, or 304 Not Modified
     """
     settings = get_settings()
     video_path = settings.output_directory / video_filename
 
-    if not video_path.exists():
+    try:
+        stat_result = video_path.stat()
+    except OSError:
+        raise HTTPException(status_code=404, detail="Video file not found")
+    if not stat.S_ISREG(stat_result.st_mode):
         raise HTTPException(status_code=404, detail="Video file not found")
 
-    return FileResponse(
+    etag = _video_etag(stat_result)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=304, headers={"ETag": etag, "Cache-Control": VIDEO_CACHE_CONTROL}
+        )
+
+    return VideoFileResponse(
         path=video_path,
         media_type="video/mp4",
         filename=video_filename,
+        stat_result=stat_result,
+        headers={"ETag": etag, "Cache-Control": VIDEO_CACHE_CONTROL},
     )
 
 
@@ -1,15 +1,36 @@
 """FastAPI application entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from slowapi.errors import RateLimitExceeded
 
 from app.api.endpoints import router
+from app.api.rate_limit import limiter, rate_limit_exceeded_handler
+from app.core.config import ensure_directory, get_settings
+from app.core.font_manager import warm_up_fonts
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Prepare output and temp directories and warm rendering caches at startup."""
+    settings = get_settings()
+    ensure_directory(settings.output_directory)
+    ensure_directory(settings.temp_directory)
+    warm_up_fonts()
+    yield
+
 
 app = FastAPI(
     title="Story to Reel API",
     description="Automated video generation engine API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 app.include_router(router)
 
 
@@ -0,0 +1,37 @@
+"""Per-client rate limiting for expensive API endpoints."""
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
+
+from app.core.config import get_settings
+
+# Counters live in settings.rate_limit_storage_uri: in-memory by default,
+# point it at Redis so the limits are shared across API replicas.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=get_settings().rate_limit_storage_uri,
+)
+
+
+async def rate_limit_exceeded_handler(request: Request, exc: Exception) -> JSONResponse:
+    """
+    Respond with 429 and a Retry-After of one rate limit window.
+
+    Args:
+        request: Request that exceeded its limit
+        exc: Rate limit exception raised by the limiter
+
+    Returns:
+        429 JSON response
+    """
+    # Typed as Exception to match Starlette's handler signature
+    assert isinstance(exc, RateLimitExceeded)
+    headers = {"Retry-After": str(exc.limit.limit.get_expiry())} if exc.limit else None
+    return JSONResponse(
+        status_code=429,
+        content={"detail": f"Rate limit exceeded: {exc.detail}"},
+        headers=headers,
+    )
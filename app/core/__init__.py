@@ -5,12 +5,13 @@ This module provides:
 - FontManager: Font path detection and validation (OS-specific)
 - get_settings(): Cached settings instance
 - get_font_path(): Default font path helper
+- warm_up_fonts(): Preload fonts and PIL before the first render
 
 See ARCHITECTURE.md for detailed module descriptions.
 """
 
 from app.core.config import Settings, get_settings
-from app.core.font_manager import FontManager, get_font_path
+from app.core.font_manager import FontManager, get_font_path, warm_up_fonts
 
-__all__ = ["Settings", "get_settings", "FontManager", "get_font_path"]
+__all__ = ["Settings", "get_settings", "FontManager", "get_font_path", "warm_up_fonts"]
 
@@ -1,11 +1,42 @@
 """Application configuration management."""
 
 import os
-from functools import lru_cache
+import platform
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import Final
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Candidate default fonts per OS (platform.system() value), in order of preference
+_PLATFORM_FONTS: Final[dict[str, tuple[str, ...]]] = {
+    "Darwin": (
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",
+    ),
+    "Linux": (
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    ),
+    "Windows": (
+        "C:/Windows/Fonts/msgothic.ttc",
+        "C:/Windows/Fonts/meiryo.ttc",
+    ),
+}
+
+
+@cache
+def _detect_default_font() -> str:
+    """Detect default font path based on OS (cached for the process lifetime)."""
+    fonts = _PLATFORM_FONTS.get(platform.system(), ())
+
+    for font_path in fonts:
+        if os.path.exists(font_path):
+            return font_path
+
+    # Fallback: return first font path (may not exist)
+    return fonts[0] if fonts else ""
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -16,10 +47,27 @@ class Settings(BaseSettings):
     # Font Configuration
     default_font_path: str | None = None
 
+    # LLM Script Cache (exact-match disk cache of generated scripts)
+    llm_cache_enabled: bool = False
+
     # Output Configuration
     output_directory: Path = Path("output")
     temp_directory: Path = Path("temp")
 
+    # Task Queue Configuration (Celery)
+    use_task_queue: bool = True
+    broker_url: str = "redis://localhost:6379/0"
+    result_backend: str = "redis://localhost:6379/1"
+
+    # In-process Generation Limits (used when use_task_queue is False)
+    max_concurrent_generations: int = 2
+    max_queued_generations: int = 8
+
+    # API Rate Limits (per client IP, slowapi/limits syntax)
+    generate_rate_limit: str = "5/minute"
+    video_rate_limit: str = "60/minute"
+    rate_limit_storage_uri: str = "memory://"
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -30,39 +78,7 @@ class Settings(BaseSettings):
         """Initialize settings with default font path detection."""
         super().__init__(**kwargs)
         if not self.default_font_path:
-            self.default_font_path = self._detect_default_font()
-
-    @staticmethod
-    def _detect_default_font() -> str:
-        """Detect default font path based on OS."""
-        import platform
-
-        system = platform.system()
-
-        if system == "Darwin":  # macOS
-            fonts = [
-                "/System/Library/Fonts/Helvetica.ttc",
-                "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",
-            ]
-        elif system == "Linux":
-            fonts = [
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-            ]
-        elif system == "Windows":
-            fonts = [
-                "C:/Windows/Fonts/msgothic.ttc",
-                "C:/Windows/Fonts/meiryo.ttc",
-            ]
-        else:
-            fonts = []
-
-        for font_path in fonts:
-            if os.path.exists(font_path):
-                return font_path
-
-        # Fallback: return first font path (may not exist)
-        return fonts[0] if fonts else ""
+            self.default_font_path = _detect_default_font()
 
 
 @lru_cache()
@@ -70,3 +86,20 @@ def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
 
+
+def ensure_directory(path: Path) -> Path:
+    """
+    Create a directory if needed, with a single stat when it already exists.
+
+    Not cached: a directory removed at runtime (e.g. by temp cleanup) is recreated.
+
+    Args:
+        path: Directory to create
+
+    Returns:
+        The same path, for chaining
+    """
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+    return path
+
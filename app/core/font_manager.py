@@ -1,10 +1,28 @@
 """Font management utilities."""
 
+from functools import cache
 from pathlib import Path
 
+from PIL import Image, ImageFont
+
 from app.core.config import get_settings
 
 
+# Fonts already found on disk. Misses are not cached, so a font installed
+# (or a volume mounted) after the first lookup is picked up.
+_found_fonts: set[str] = set()
+
+
+def _font_exists(path: str) -> bool:
+    """Check whether a font file exists, skipping the stat for known fonts."""
+    if path in _found_fonts:
+        return True
+    if Path(path).exists():
+        _found_fonts.add(path)
+        return True
+    return False
+
+
 class FontManager:
     """Manages font paths for video generation."""
 
@@ -27,7 +45,7 @@ class FontManager:
         Returns:
             Font path string or None if not available
         """
-        if self.font_path and Path(self.font_path).exists():
+        if self.font_path and _font_exists(self.font_path):
             return self.font_path
         return None
 
@@ -38,7 +56,7 @@ class FontManager:
         Returns:
             True if font exists, False otherwise
         """
-        return self.font_path is not None and Path(self.font_path).exists()
+        return self.font_path is not None and _font_exists(self.font_path)
 
 
 def get_font_path() -> str | None:
@@ -51,3 +69,44 @@ def get_font_path() -> str | None:
     manager = FontManager()
     return manager.get_font_path()
 
+
+@cache
+def load_font(font_path: str | None, size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """
+    Load a font at a given size (cached: FreeType parses each font file once).
+
+    Args:
+        font_path: Path to a TrueType/OpenType font, or None for Pillow's default font
+        size: Font size in pixels
+
+    Returns:
+        Loaded font
+
+    Raises:
+        OSError: If the font file cannot be read
+    """
+    if font_path:
+        return ImageFont.truetype(font_path, size)
+    return ImageFont.load_default(size=size)
+
+
+def warm_up_fonts(size: int = 70) -> None:
+    """
+    Load FreeType, the default font and PIL's imaging core ahead of the first render.
+
+    Called once at API startup and in each Celery worker process, so the
+    first video request does not pay the one-time initialization cost.
+    MoviePy is not preloaded: it is imported lazily and only by the optional
+    MoviePy composer, so the default ffmpeg pipeline never needs it.
+
+    Args:
+        size: Font size to load (default: 70, the subtitle size)
+    """
+    font_path = get_font_path()
+    if font_path:
+        try:
+            load_font(font_path, size)
+        except OSError:
+            # Unreadable font: rendering reports it on first use
+            pass
+    Image.new("RGB", (16, 16))
@@ -4,6 +4,8 @@ from abc import abstractmethod
 from pathlib import Path
 from typing import Protocol
 
+import numpy as np
+
 
 class AssetManager(Protocol):
     """Protocol defining the interface for asset management."""
@@ -28,10 +30,38 @@ class AssetManager(Protocol):
         """
         ...
 
+    @abstractmethod
+    def generate_audio_batch(
+        self, items: list[tuple[str, Path, str]], return_exceptions: bool = False
+    ) -> list[Path | BaseException]:
+        """
+        Generate several audio files in one batch.
+
+        Implementations may use a native batch API or overlap individual
+        requests; either way per-request overhead is amortized across items.
+
+        Args:
+            items: List of (text, output_path, language) tuples
+            return_exceptions: Return each failure in place of its path instead
+                               of raising the first one
+
+        Returns:
+            Paths to generated audio files (or exceptions), in the same order as items
+
+        Raises:
+            Exception: If any audio generation fails and return_exceptions is False
+        """
+        ...
+
     @abstractmethod
     def get_background_image(
-        self, width: int, height: int, scene_number: int, color: str | None = None
-    ) -> Path:
+        self,
+        width: int,
+        height: int,
+        scene_number: int,
+        color: str | None = None,
+        persist: bool = False,
+    ) -> Path | np.ndarray:
         """
         Get or generate background image for a scene.
 
@@ -40,9 +70,10 @@ class AssetManager(Protocol):
             height: Image height in pixels
             scene_number: Scene number for variation
             color: Optional background color (hex format)
+            persist: Return a path to an image file instead of an in-memory array
 
         Returns:
-            Path to background image file
+            (height, width, 3) uint8 RGB array, or path to the image file if persist is set
 
         Raises:
             Exception: If image generation/retrieval fails
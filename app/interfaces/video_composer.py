@@ -4,6 +4,8 @@ from abc import abstractmethod
 from pathlib import Path
 from typing import Protocol
 
+import numpy as np
+
 from app.models.video_script import VideoScript
 
 
@@ -12,7 +14,11 @@ class VideoComposer(Protocol):
 
     @abstractmethod
     def compose(
-        self, script: VideoScript, output_path: Path, assets: dict[str, Path]
+        self,
+        script: VideoScript,
+        output_path: Path,
+        bg_assets: dict[int, Path | np.ndarray],
+        audio_assets: dict[int, Path],
     ) -> Path:
         """
         Compose video from script and assets.
@@ -20,7 +26,8 @@ class VideoComposer(Protocol):
         Args:
             script: VideoScript object containing scene definitions
             output_path: Path where output video should be saved
-            assets: Dictionary mapping scene numbers or keys to asset paths
+            bg_assets: Background image per scene number (path or in-memory RGB array)
+            audio_assets: Audio file per scene number; scenes without one are silent
 
         Returns:
             Path to generated video file
@@ -4,6 +4,7 @@ This module contains concrete implementations of interfaces:
 - LLM Providers: MockLLMProvider (test), OpenAILLMProvider (OpenAI API)
 - ScriptGenerator: Converts text input to VideoScript objects
 - SimpleAssetManager: Generates audio (gTTS) and background images (PIL)
+- FFmpegVideoComposer: Renders video with ffmpeg directly (default)
 - MoviePyVideoComposer: Renders video using MoviePy
 - generate_video_from_text(): Main orchestration function
 
@@ -11,22 +12,20 @@ All services implement protocols defined in app.interfaces.
 See ARCHITECTURE.md for detailed descriptions.
 """
 
-from app.services.llm_provider import MockLLMProvider, OpenAILLMProvider
+from app.services.llm_provider import MockLLMProvider, OpenAILLMProvider, get_openai_provider
 from app.services.script_generator import ScriptGenerator
 from app.services.asset_manager import SimpleAssetManager
+from app.services.ffmpeg_composer import FFmpegVideoComposer
+from app.services.video_composer import MoviePyVideoComposer  # Imports MoviePy on first compose()
 from app.services.video_generator import generate_video_from_text
 
-# MoviePyVideoComposer may fail if moviepy is not installed - use lazy import
-try:
-    from app.services.video_composer import MoviePyVideoComposer
-except ImportError:
-    MoviePyVideoComposer = None  # type: ignore
-
 __all__ = [
     "MockLLMProvider",
     "OpenAILLMProvider",
+    "get_openai_provider",
     "ScriptGenerator",
     "SimpleAssetManager",
+    "FFmpegVideoComposer",
     "MoviePyVideoComposer",
     "generate_video_from_text",
 ]
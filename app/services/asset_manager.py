@@ -1,12 +1,27 @@
 """Asset manager implementation for audio and image generation."""
 
+import asyncio
 import colorsys
+import hashlib
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-from PIL import Image, ImageDraw
+import numpy as np
+from PIL import Image
 from gtts import gTTS
 
-from app.core.config import get_settings
+from app.core.config import ensure_directory, get_settings
+
+# Shared pool for TTS requests: gTTS calls are dominated by network round-trips,
+# so threads overlap them cheaply. The pool size also caps concurrent requests.
+TTS_MAX_WORKERS = 32
+_tts_executor = ThreadPoolExecutor(max_workers=TTS_MAX_WORKERS, thread_name_prefix="tts")
+
+# Pixel spacing of the background grid lines
+GRID_SPACING = 50
 
 
 class SimpleAssetManager:
@@ -20,8 +35,7 @@ class SimpleAssetManager:
             output_dir: Directory for storing generated assets (default: temp directory)
         """
         settings = get_settings()
-        self.output_dir = output_dir or settings.temp_directory
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir = ensure_directory(output_dir or settings.temp_directory)
 
     def generate_audio(
         self, text: str, output_path: Path, language: str = "ja"
@@ -44,8 +58,7 @@ class SimpleAssetManager:
             raise ValueError("Text cannot be empty for audio generation")
 
         try:
-            # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            ensure_directory(output_path.parent)
 
             # Generate TTS audio
             tts = gTTS(text=text, lang=language, slow=False)
@@ -59,20 +72,79 @@ class SimpleAssetManager:
         except Exception as e:
             raise RuntimeError(f"Failed to generate audio: {e}") from e
 
+    def generate_audio_batch(
+        self, items: list[tuple[str, Path, str]], return_exceptions: bool = False
+    ) -> list[Path | BaseException]:
+        """
+        Generate multiple audio files concurrently.
+
+        Args:
+            items: List of (text, output_path, language) tuples
+            return_exceptions: Return each failure in place of its path instead
+                               of raising the first one (like asyncio.gather)
+
+        Returns:
+            Paths to generated audio files (or exceptions), in the same order as items
+
+        Raises:
+            Exception: If any audio generation fails and return_exceptions is False
+        """
+        futures = [_tts_executor.submit(self.generate_audio, *item) for item in items]
+        if not return_exceptions:
+            return [future.result() for future in futures]
+        return [future.exception() or future.result() for future in futures]
+
+    async def generate_audio_batch_async(
+        self, items: list[tuple[str, Path, str]], return_exceptions: bool = False
+    ) -> list[Path | BaseException]:
+        """
+        Generate multiple audio files concurrently without blocking the event loop.
+
+        Args:
+            items: List of (text, output_path, language) tuples
+            return_exceptions: Return each failure in place of its path instead
+                               of raising the first one (like asyncio.gather)
+
+        Returns:
+            Paths to generated audio files (or exceptions), in the same order as items
+
+        Raises:
+            Exception: If any audio generation fails and return_exceptions is False
+        """
+        loop = asyncio.get_running_loop()
+        return list(
+            await asyncio.gather(
+                *(loop.run_in_executor(_tts_executor, self.generate_audio, *item) for item in items),
+                return_exceptions=return_exceptions,
+            )
+        )
+
     def get_background_image(
-        self, width: int, height: int, scene_number: int, color: str | None = None
-    ) -> Path:
+        self,
+        width: int,
+        height: int,
+        scene_number: int,
+        color: str | None = None,
+        persist: bool = False,
+    ) -> Path | np.ndarray:
         """
         Generate or retrieve background image for a scene.
 
+        By default the image is returned as an in-memory RGB array, which the
+        composer uses directly, avoiding a PNG encode, write and decode per scene.
+        Arrays are read-only and tiled from a small per-color grid cell, so no
+        full frames are kept in memory between calls.
+
         Args:
             width: Image width in pixels
             height: Image height in pixels
             scene_number: Scene number for variation
             color: Optional background color (hex format)
+            persist: Save the image as a PNG and return its path instead
+                     (files are cached by (width, height, color) too)
 
         Returns:
-            Path to background image file
+            (height, width, 3) uint8 array, or path to the image file if persist is set
 
         Raises:
             Exception: If image generation fails
@@ -86,22 +158,30 @@ class SimpleAssetManager:
                 hue = (scene_number * 137.5) % 360 / 360.0  # Golden angle for variation
                 saturation = 0.6
                 lightness = 0.3
-                rgb = colorsys.hls_to_rgb(hue, lightness, saturation)
-                bg_color = tuple(int(c * 255) for c in rgb)
+                r, g, b = colorsys.hls_to_rgb(hue, lightness, saturation)
+                bg_color = (int(r * 255), int(g * 255), int(b * 255))
+
+            if not persist:
+                return self._render_background(width, height, bg_color)
 
-            # Create image
-            image = Image.new("RGB", (width, height), bg_color)
-            draw = ImageDraw.Draw(image)
+            # Content-addressed path: identical parameters reuse the same file
+            key = hashlib.blake2b(
+                f"{width}x{height}:{bg_color}".encode(), digest_size=8
+            ).hexdigest()
+            image_path = self.output_dir / f"bg_{key}.png"
+            if image_path.exists():
+                return image_path
 
-            # Add subtle pattern for visual interest
-            for i in range(0, width, 50):
-                draw.line([(i, 0), (i, height)], fill=(*bg_color, 30), width=1)
-            for i in range(0, height, 50):
-                draw.line([(0, i), (width, i)], fill=(*bg_color, 30), width=1)
+            image = Image.fromarray(self._render_background(width, height, bg_color))
 
-            # Save image
-            image_path = self.output_dir / f"bg_scene_{scene_number}.png"
-            image.save(image_path, "PNG")
+            # Save atomically so concurrent readers never see a partial file
+            # (fast compression: the PNG is a short-lived intermediate)
+            tmp_path = image_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            try:
+                image.save(tmp_path, "PNG", compress_level=1)
+                os.replace(tmp_path, image_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
 
             return image_path
 
@@ -109,9 +189,59 @@ class SimpleAssetManager:
             raise RuntimeError(f"Failed to generate background image: {e}") from e
 
     @staticmethod
+    def _render_background(
+        width: int, height: int, bg_color: tuple[int, int, int]
+    ) -> np.ndarray:
+        """
+        Render a solid background with a subtle grid (returned read-only).
+
+        Full frames are not cached (tens of MB each at 1080p and above); they
+        are tiled from a small cached grid cell instead.
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            bg_color: Background RGB tuple
+
+        Returns:
+            (height, width, 3) uint8 array
+        """
+        tile = SimpleAssetManager._grid_tile(bg_color)
+        reps_y = -(-height // GRID_SPACING)
+        reps_x = -(-width // GRID_SPACING)
+        pixels = np.ascontiguousarray(np.tile(tile, (reps_y, reps_x, 1))[:height, :width])
+
+        pixels.flags.writeable = False
+        return pixels
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _grid_tile(bg_color: tuple[int, int, int]) -> np.ndarray:
+        """
+        Build one grid cell: the background with a grid line along its top and left edges.
+
+        Args:
+            bg_color: Background RGB tuple
+
+        Returns:
+            (GRID_SPACING, GRID_SPACING, 3) read-only uint8 array
+        """
+        tile = np.empty((GRID_SPACING, GRID_SPACING, 3), dtype=np.uint8)
+        tile[:] = bg_color
+
+        # Add subtle grid pattern for visual interest
+        grid_color = SimpleAssetManager._grid_color(bg_color)
+        tile[:, 0] = grid_color
+        tile[0, :] = grid_color
+
+        tile.flags.writeable = False
+        return tile
+
+    @staticmethod
+    @lru_cache(maxsize=256)
     def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
         """
-        Convert hex color string to RGB tuple.
+        Convert hex color string to RGB tuple (cached: scene colors repeat).
 
         Args:
             hex_color: Hex color string (e.g., "#1a1a2e" or "1a1a2e")
@@ -119,9 +249,28 @@ class SimpleAssetManager:
         Returns:
             RGB tuple (r, g, b)
         """
-        hex_color = hex_color.lstrip("#")
-        if len(hex_color) != 6:
+        hex_digits = hex_color.lstrip("#")
+        if len(hex_digits) != 6:
             raise ValueError(f"Invalid hex color: {hex_color}")
 
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+        try:
+            r, g, b = bytes.fromhex(hex_digits)
+        except ValueError:
+            raise ValueError(f"Invalid hex color: {hex_color}") from None
+        return (r, g, b)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _grid_color(bg_color: tuple[int, int, int]) -> tuple[int, int, int]:
+        """
+        Get the grid line color for a background: white blended at alpha 30/255.
+
+        Args:
+            bg_color: Background RGB tuple
+
+        Returns:
+            Grid RGB tuple
+        """
+        r, g, b = ((c * 225 + 255 * 30) // 255 for c in bg_color)
+        return (r, g, b)
 
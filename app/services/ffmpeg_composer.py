@@ -0,0 +1,246 @@
+"""Video composer implementation driving ffmpeg directly."""
+
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import imageio_ffmpeg
+import numpy as np
+
+from app.core.config import ensure_directory
+from app.core.font_manager import get_font_path
+from app.models.video_script import Scene, VideoScript
+from app.services.scene_frame import render_scene_frame
+
+# Audio parameters shared by every scene segment, so the concat demuxer can
+# join them with stream copy
+AUDIO_SAMPLE_RATE = 44100
+AUDIO_CHANNELS = 2
+
+# Scenes are static stills: a fast preset loses little quality, and
+# stillimage tuning cuts motion-estimation work. Threads are set per scene.
+X264_OPTIONS = ["-preset", "veryfast", "-tune", "stillimage"]
+
+
+def run_ffmpeg(ffmpeg: str, args: list[str], stdin: bytes | None = None) -> None:
+    """
+    Run ffmpeg, raising with its error output on failure.
+
+    Args:
+        ffmpeg: Path to the ffmpeg executable
+        args: ffmpeg arguments (after global options)
+        stdin: Optional bytes to feed on standard input
+
+    Raises:
+        RuntimeError: If ffmpeg exits with a non-zero status
+    """
+    result = subprocess.run(
+        [ffmpeg, "-hide_banner", "-loglevel", "error", "-y", *args],
+        input=stdin,
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg failed: {result.stderr.decode(errors='replace').strip()}"
+        )
+
+
+def concat_segments(ffmpeg: str, segments: list[Path], output_path: Path) -> None:
+    """
+    Join MP4 segments with identical streams without re-encoding.
+
+    Uses the concat demuxer with stream copy; the list file is written next
+    to the first segment.
+
+    Args:
+        ffmpeg: Path to the ffmpeg executable
+        segments: Segment files, in playback order
+        output_path: Where to write the joined video
+
+    Raises:
+        RuntimeError: If ffmpeg fails
+    """
+    concat_list = segments[0].parent / "concat.txt"
+    concat_list.write_text(
+        "".join(f"file '{_escape_concat_path(path)}'\n" for path in segments),
+        encoding="utf-8",
+    )
+    run_ffmpeg(
+        ffmpeg,
+        [
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(concat_list),
+            "-c", "copy",
+            "-movflags", "+faststart",
+            str(output_path),
+        ],
+    )
+
+
+def _escape_concat_path(path: Path) -> str:
+    """Escape a path for a single-quoted concat demuxer 'file' directive."""
+    return str(path.resolve()).replace("'", "'\\''")
+
+
+class FFmpegVideoComposer:
+    """
+    Video composer that encodes each scene with ffmpeg and joins them losslessly.
+
+    Every scene is a still frame (background + baked-in subtitle) plus audio,
+    so instead of rendering frames in Python the frame is piped to ffmpeg once
+    and looped. Scenes are encoded concurrently to temporary segments, then
+    joined with the concat demuxer (stream copy, no re-encode).
+    """
+
+    def __init__(
+        self,
+        width: int = 1920,
+        height: int = 1080,
+        font_path: str | None = None,
+        fps: int = 24,
+        max_workers: int | None = None,
+    ):
+        """
+        Initialize FFmpegVideoComposer.
+
+        Args:
+            width: Video width in pixels (default: 1920)
+            height: Video height in pixels (default: 1080)
+            font_path: Optional font path for subtitles
+            fps: Output frame rate (default: 24)
+            max_workers: Scenes encoded concurrently (default: min(4, CPU count))
+        """
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
+
+        # Default font is resolved once per process
+        self.font_path = font_path or get_font_path()
+
+    def compose(
+        self,
+        script: VideoScript,
+        output_path: Path,
+        bg_assets: dict[int, Path | np.ndarray],
+        audio_assets: dict[int, Path],
+    ) -> Path:
+        """
+        Compose video from script and assets.
+
+        Args:
+            script: VideoScript object containing scene definitions
+            output_path: Path where output video should be saved
+            bg_assets: Background image per scene number (path or in-memory RGB array)
+            audio_assets: Audio file per scene number; scenes without one are silent
+
+        Returns:
+            Path to generated video file
+
+        Raises:
+            Exception: If video composition fails
+        """
+        try:
+            if not script.scenes:
+                raise ValueError("No video clips generated from script")
+
+            ensure_directory(output_path.parent)
+
+            with tempfile.TemporaryDirectory(dir=output_path.parent) as work_dir:
+                segments = [
+                    Path(work_dir) / f"scene_{idx:04d}.mp4" for idx in range(len(script.scenes))
+                ]
+                workers = min(self.max_workers, len(script.scenes))
+                # Share the cores between the scene encoders
+                threads = max(1, (os.cpu_count() or 1) // workers)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # list() propagates the first encoding error
+                    list(
+                        executor.map(
+                            lambda scene, segment: self._encode_scene(
+                                scene, bg_assets, audio_assets, segment, threads
+                            ),
+                            script.scenes,
+                            segments,
+                        )
+                    )
+
+                concat_segments(self.ffmpeg, segments, output_path)
+
+            return output_path
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to compose video: {e}") from e
+
+    def _encode_scene(
+        self,
+        scene: Scene,
+        bg_assets: dict[int, Path | np.ndarray],
+        audio_assets: dict[int, Path],
+        segment_path: Path,
+        threads: int,
+    ) -> Path:
+        """
+        Encode a single scene to an MP4 segment.
+
+        Args:
+            scene: Scene object
+            bg_assets: Background image per scene number
+            audio_assets: Audio file per scene number
+            segment_path: Where to write the segment
+            threads: Encoder threads for this segment
+
+        Returns:
+            Path to the encoded segment
+        """
+        background = bg_assets.get(scene.scene_number)
+        if background is None:
+            raise ValueError(f"Background asset not found for scene {scene.scene_number}")
+
+        frame = render_scene_frame(
+            background, scene.display_text, self.width, self.height, self.font_path
+        )
+        frame_count = max(1, round(scene.duration_seconds * self.fps))
+
+        # Audio is looped and cut to the scene duration; scenes without audio
+        # get silence so every segment has identical streams
+        audio_path = audio_assets.get(scene.scene_number)
+        if audio_path is not None and audio_path.exists():
+            audio_input = ["-stream_loop", "-1", "-i", str(audio_path)]
+        else:
+            audio_input = [
+                "-f", "lavfi",
+                "-i", f"anullsrc=r={AUDIO_SAMPLE_RATE}:cl=stereo",
+            ]
+
+        run_ffmpeg(
+            self.ffmpeg,
+            [
+                # One raw RGB frame on stdin, repeated by the loop filter
+                "-f", "rawvideo",
+                "-pix_fmt", "rgb24",
+                "-s", f"{self.width}x{self.height}",
+                "-framerate", str(self.fps),
+                "-i", "pipe:0",
+                *audio_input,
+                "-filter:v", f"loop=loop={frame_count - 1}:size=1:start=0",
+                "-frames:v", str(frame_count),
+                "-t", f"{scene.duration_seconds:.3f}",
+                "-map", "0:v",
+                "-map", "1:a",
+                "-c:v", "libx264",
+                *X264_OPTIONS,
+                "-threads", str(threads),
+                "-pix_fmt", "yuv420p",
+                "-c:a", "aac",
+                "-ar", str(AUDIO_SAMPLE_RATE),
+                "-ac", str(AUDIO_CHANNELS),
+                str(segment_path),
+            ],
+            stdin=frame.tobytes(),
+        )
+        return segment_path
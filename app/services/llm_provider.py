@@ -1,7 +1,12 @@
 """LLM provider implementations."""
 
-import json
 import os
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import orjson
 
 from app.core.config import get_settings
 
@@ -22,6 +27,47 @@ except ImportError:
         ChatOpenAI = None  # type: ignore
 
 
+# Sentence boundaries for the mock provider: after "." / "。", or at a newline
+_SENTENCE_SPLIT = re.compile(r"(?<=[.。])|\n")
+
+# Background colors for mock scenes 1-5
+_MOCK_COLORS = tuple(
+    f"#{idx * 30 % 255:02x}{idx * 50 % 255:02x}{idx * 70 % 255:02x}" for idx in range(1, 6)
+)
+
+# Maximum number of cached responses per OpenAILLMProvider instance
+OPENAI_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=256)
+def _generate_mock(input_text: str) -> str:
+    """Build mock script JSON (cached: output depends only on input_text)."""
+    # Simple mock implementation: split input into scenes
+    sentences = [s.strip() for s in _SENTENCE_SPLIT.split(input_text) if s.strip()]
+
+    scenes = []
+    for idx, sentence in enumerate(sentences[:5], 1):  # Limit to 5 scenes
+        if not sentence:
+            continue
+        scene = {
+            "scene_number": idx,
+            "dialogue": sentence,
+            "display_text": sentence,
+            "duration_seconds": max(2.0, len(sentence) * 0.1),
+            "background_color": _MOCK_COLORS[idx - 1],
+        }
+        scenes.append(scene)
+
+    script_data = {
+        "title": sentences[0][:30] if sentences else "Generated Video",
+        "scenes": scenes,
+        "total_duration_seconds": sum(s["duration_seconds"] for s in scenes),
+    }
+
+    # Compact output: the JSON is machine-parsed by ScriptGenerator
+    return orjson.dumps(script_data).decode()
+
+
 class MockLLMProvider:
     """Mock LLM provider for testing without API calls."""
 
@@ -35,47 +81,55 @@ class MockLLMProvider:
         Returns:
             JSON string containing mock video script structure
         """
-        # Simple mock implementation: split input into scenes
-        sentences = [
-            s.strip()
-            for s in input_text.replace(".", ".\n")
-            .replace("。", "。\n")
-            .split("\n")
-            if s.strip()
-        ]
-
-        scenes = []
-        for idx, sentence in enumerate(sentences[:5], 1):  # Limit to 5 scenes
-            if not sentence:
-                continue
-            scene = {
-                "scene_number": idx,
-                "dialogue": sentence,
-                "display_text": sentence,
-                "duration_seconds": max(2.0, len(sentence) * 0.1),
-                "background_color": f"#{idx * 30 % 255:02x}{idx * 50 % 255:02x}{idx * 70 % 255:02x}",
-            }
-            scenes.append(scene)
-
-        script_data = {
-            "title": sentences[0][:30] if sentences else "Generated Video",
-            "scenes": scenes,
-            "total_duration_seconds": sum(s["duration_seconds"] for s in scenes),
-        }
+        return _generate_mock(input_text)
+
+
+_OPENAI_SYSTEM_PROMPT = """You are a video script generator. Generate a JSON structure for a video script based on the input text.
+
+The output must be valid JSON with this structure:
+{{
+  "title": "Video title",
+  "scenes": [
+    {{
+      "scene_number": 1,
+      "dialogue": "Text to speak",
+      "display_text": "Text to display",
+      "duration_seconds": 3.0,
+      "background_color": "#1a1a2e"
+    }}
+  ],
+  "total_duration_seconds": 10.0
+}}
 
-        return json.dumps(script_data, ensure_ascii=False, indent=2)
+Split the input text into 3-5 scenes. Each scene should have appropriate duration based on text length."""
 
 
 class OpenAILLMProvider:
     """OpenAI-based LLM provider using LangChain."""
 
-    def __init__(self, model_name: str = "gpt-4", temperature: float = 0.7):
+    # Built once at import instead of per instance
+    _PROMPT_TEMPLATE = (
+        ChatPromptTemplate.from_messages(
+            [("system", _OPENAI_SYSTEM_PROMPT), ("user", "{input_text}")]
+        )
+        if LANGCHAIN_AVAILABLE
+        else None
+    )
+
+    def __init__(
+        self,
+        model_name: str = "gpt-4",
+        temperature: float = 0.7,
+        cache: bool | None = None,
+    ):
         """
         Initialize OpenAI LLM provider.
 
         Args:
             model_name: OpenAI model name (default: "gpt-4")
             temperature: Sampling temperature (default: 0.7)
+            cache: Cache responses per input text (default: only when temperature is 0,
+                   so intentional sampling variance is not hidden)
 
         Raises:
             ImportError: If langchain packages are not installed
@@ -95,33 +149,15 @@ class OpenAILLMProvider:
                 "OPENAI_API_KEY not found in environment variables or settings"
             )
 
-        self.llm = ChatOpenAI(model=model_name, temperature=temperature, api_key=api_key)
-        self.prompt_template = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    """You are a video script generator. Generate a JSON structure for a video script based on the input text.
-
-The output must be valid JSON with this structure:
-{{
-  "title": "Video title",
-  "scenes": [
-    {{
-      "scene_number": 1,
-      "dialogue": "Text to speak",
-      "display_text": "Text to display",
-      "duration_seconds": 3.0,
-      "background_color": "#1a1a2e"
-    }}
-  ],
-  "total_duration_seconds": 10.0
-}}
+        self.model_name = model_name
+        self.temperature = temperature
+        self.cache_enabled = temperature == 0 if cache is None else cache
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
-Split the input text into 3-5 scenes. Each scene should have appropriate duration based on text length.""",
-                ),
-                ("user", "{input_text}"),
-            ]
-        )
+        self.llm = ChatOpenAI(model=model_name, temperature=temperature, api_key=api_key)
+        assert self._PROMPT_TEMPLATE is not None  # built whenever LANGCHAIN_AVAILABLE
+        self.prompt_template = self._PROMPT_TEMPLATE
 
     def generate_script_content(self, input_text: str) -> str:
         """
@@ -136,6 +172,12 @@ Split the input text into 3-5 scenes. Each scene should have appropriate duratio
         Raises:
             Exception: If API call fails
         """
+        if self.cache_enabled:
+            with self._cache_lock:
+                if input_text in self._cache:
+                    self._cache.move_to_end(input_text)
+                    return self._cache[input_text]
+
         chain = self.prompt_template | self.llm
         response = chain.invoke({"input_text": input_text})
 
@@ -148,6 +190,35 @@ Split the input text into 3-5 scenes. Each scene should have appropriate duratio
             content = content[3:]
         if content.endswith("```"):
             content = content[:-3]
+        content = content.strip()
+
+        if self.cache_enabled:
+            with self._cache_lock:
+                self._cache[input_text] = content
+                if len(self._cache) > OPENAI_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
+        return content
+
+
+@lru_cache(maxsize=8)
+def get_openai_provider(model_name: str = "gpt-4", temperature: float = 0.7) -> OpenAILLMProvider:
+    """
+    Get a shared OpenAILLMProvider instance.
+
+    Reusing the instance keeps the ChatOpenAI HTTP client and its connection
+    pool alive across requests instead of re-handshaking TCP/TLS each time.
+
+    Args:
+        model_name: OpenAI model name (default: "gpt-4")
+        temperature: Sampling temperature (default: 0.7)
+
+    Returns:
+        Cached OpenAILLMProvider instance
 
-        return content.strip()
+    Raises:
+        ImportError: If langchain packages are not installed
+        ValueError: If API key is not found
+    """
+    return OpenAILLMProvider(model_name=model_name, temperature=temperature)
 
@@ -0,0 +1,130 @@
+"""Render a scene's still frame: background with the subtitle baked in."""
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from app.core.font_manager import load_font
+
+SUBTITLE_FONT_SIZE = 70
+SUBTITLE_COLOR = "white"
+SUBTITLE_WIDTH_RATIO = 0.8  # Max subtitle line width relative to frame width
+SUBTITLE_BOTTOM_RATIO = 0.95  # Bottom edge of the subtitle block relative to frame height
+
+# Shared 1x1 canvas for measuring text; drawing never touches it
+_measure_draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+Font = ImageFont.FreeTypeFont | ImageFont.ImageFont
+
+
+def _wrap_text(text: str, font: Font, max_width: float) -> str:
+    """
+    Wrap text to lines no wider than max_width.
+
+    Breaks at the last space when a line has one, otherwise between any two
+    characters (Japanese text has no spaces).
+
+    Args:
+        text: Text to wrap
+        font: Font used to measure line widths
+        max_width: Maximum line width in pixels
+
+    Returns:
+        Text with newlines inserted
+    """
+    lines: list[str] = []
+    for paragraph in text.splitlines() or [""]:
+        line = ""
+        for char in paragraph:
+            if line and font.getlength(line + char) > max_width:
+                head, space, tail = line.rpartition(" ")
+                if space and head:
+                    lines.append(head)
+                    line = tail
+                else:
+                    lines.append(line)
+                    line = ""
+                if char == " " and not line:
+                    continue
+            line += char
+        lines.append(line)
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def _layout_subtitle(
+    text: str, font: Font, max_width: float
+) -> tuple[str, tuple[float, float, float, float]]:
+    """
+    Wrap and measure a subtitle (cached: scenes and videos repeat phrases).
+
+    Fonts come from the load_font() cache, so the same font object keys
+    every lookup for a given font and size.
+
+    Args:
+        text: Subtitle text
+        font: Font to lay out with
+        max_width: Maximum line width in pixels
+
+    Returns:
+        (wrapped text, bounding box of the wrapped text drawn at the origin)
+    """
+    wrapped = _wrap_text(text, font, max_width)
+    bbox = _measure_draw.multiline_textbbox((0, 0), wrapped, font=font, align="center")
+    return wrapped, bbox
+
+
+def render_scene_frame(
+    background: Path | np.ndarray,
+    text: str,
+    width: int,
+    height: int,
+    font_path: str | None = None,
+    font_size: int = SUBTITLE_FONT_SIZE,
+) -> Image.Image:
+    """
+    Render a scene's frame: the background resized to the output size with
+    the subtitle drawn centered near the bottom edge.
+
+    Scenes are a still image plus a static subtitle, so this frame is all
+    an encoder needs for the whole scene.
+
+    Args:
+        background: Background image path or RGB array
+        text: Subtitle text
+        width: Frame width in pixels
+        height: Frame height in pixels
+        font_path: Optional font path (default: Pillow's built-in font)
+        font_size: Subtitle font size in pixels
+
+    Returns:
+        RGB frame image
+    """
+    if isinstance(background, np.ndarray):
+        frame = Image.fromarray(background)
+    else:
+        with Image.open(background) as image:
+            frame = image.convert("RGB")
+    if frame.size != (width, height):
+        frame = frame.resize((width, height))
+    elif isinstance(background, np.ndarray):
+        # fromarray shares the (read-only) buffer: draw on a copy
+        frame = frame.copy()
+
+    if not text.strip():
+        return frame
+
+    font = load_font(font_path, font_size)
+    wrapped, (left, _, right, bottom) = _layout_subtitle(
+        text, font, width * SUBTITLE_WIDTH_RATIO
+    )
+
+    x = (width - (right - left)) / 2 - left
+    y = height * SUBTITLE_BOTTOM_RATIO - bottom
+    ImageDraw.Draw(frame).multiline_text(
+        (x, y), wrapped, font=font, fill=SUBTITLE_COLOR, align="center"
+    )
+
+    return frame
@@ -1,22 +1,78 @@
 """Script generator service that creates VideoScript from input text."""
 
-import json
+import hashlib
+import math
+import os
+import re
+import uuid
+from pathlib import Path
 
+import msgspec
+from pydantic import TypeAdapter
+
+from app.core.config import ensure_directory, get_settings
 from app.interfaces.llm_provider import LLMProvider
 from app.models.video_script import Scene, VideoScript
 
 
+class _SceneData(msgspec.Struct):
+    """Scene as emitted by LLM providers; omitted fields get defaults."""
+
+    scene_number: int | None = None  # Defaults to the scene's position
+    dialogue: str = ""
+    display_text: str | None = None  # Defaults to the dialogue
+    duration_seconds: float = 3.0
+    background_color: str | None = "#000000"
+    background_image_url: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.display_text is None:
+            self.display_text = self.dialogue
+
+
+class _ScriptData(msgspec.Struct):
+    """Script as emitted by LLM providers (required fields are checked after decoding)."""
+
+    title: str | None = None
+    scenes: list[_SceneData] | None = None
+    total_duration_seconds: float | None = None
+
+
+# Typed decoder built once: JSON is parsed straight into the structs, with
+# defaults applied in C. strict=False accepts numbers sent as strings.
+_script_decoder = msgspec.json.Decoder(_ScriptData, strict=False)
+
+# Validates every scene in one call, reading fields straight off the structs
+_scene_list_adapter = TypeAdapter(list[Scene])
+
+# Finds the first non-whitespace character without copying the input
+_NON_WHITESPACE = re.compile(r"\S")
+
+
 class ScriptGenerator:
     """Generates VideoScript objects from input text using LLM providers."""
 
-    def __init__(self, llm_provider: LLMProvider):
+    def __init__(
+        self,
+        llm_provider: LLMProvider,
+        cache_enabled: bool | None = None,
+        cache_dir: Path | None = None,
+    ):
         """
         Initialize ScriptGenerator.
 
         Args:
             llm_provider: LLM provider implementation
+            cache_enabled: Reuse scripts previously generated for the same provider
+                           model and input text (default: settings.llm_cache_enabled)
+            cache_dir: Directory for cached scripts (default: temp directory / "llm_cache")
         """
+        settings = get_settings()
         self.llm_provider = llm_provider
+        self.cache_enabled = (
+            settings.llm_cache_enabled if cache_enabled is None else cache_enabled
+        )
+        self.cache_dir = cache_dir or settings.temp_directory / "llm_cache"
 
     def generate(self, input_text: str) -> VideoScript:
         """
@@ -31,59 +87,115 @@ class ScriptGenerator:
         Raises:
             ValueError: If script generation or parsing fails
         """
-        if not input_text or not input_text.strip():
+        if not input_text or not _NON_WHITESPACE.search(input_text):
             raise ValueError("Input text cannot be empty")
 
-        try:
-            # Get JSON content from LLM provider
-            json_content = self.llm_provider.generate_script_content(input_text)
+        cache_path = self._cache_path(input_text) if self.cache_enabled else None
+        cached_content = self._read_cache(cache_path) if cache_path is not None else None
+
+        if cached_content is not None:
+            json_content = cached_content
+        else:
+            try:
+                # Get JSON content from LLM provider
+                json_content = self.llm_provider.generate_script_content(input_text)
+            except Exception as e:
+                raise ValueError(f"Script generation failed: {e}") from e
 
-            # Parse JSON
-            script_data = json.loads(json_content)
+        try:
+            script_data = _script_decoder.decode(json_content)
+        except (msgspec.ValidationError, TypeError) as e:
+            # TypeError: the provider returned something other than str/bytes
+            raise ValueError(f"Script generation failed: {e}") from e
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Failed to parse LLM response as JSON: {e}") from e
 
-            # Validate required fields
-            if "scenes" not in script_data:
-                raise ValueError("Generated script missing 'scenes' field")
-            if "title" not in script_data:
-                raise ValueError("Generated script missing 'title' field")
+        # Validate required fields
+        if script_data.scenes is None:
+            raise ValueError("Generated script missing 'scenes' field")
+        if script_data.title is None:
+            raise ValueError("Generated script missing 'title' field")
 
+        try:
             # Build VideoScript object
-            scenes = [
-                Scene(
-                    scene_number=scene_data.get("scene_number", idx + 1),
-                    dialogue=scene_data.get("dialogue", ""),
-                    display_text=scene_data.get("display_text", scene_data.get("dialogue", "")),
-                    duration_seconds=float(scene_data.get("duration_seconds", 3.0)),
-                    background_color=scene_data.get("background_color", "#000000"),
-                    background_image_url=scene_data.get("background_image_url"),
-                )
-                for idx, scene_data in enumerate(script_data["scenes"])
-            ]
-
-            total_duration = script_data.get(
-                "total_duration_seconds",
-                sum(scene.duration_seconds for scene in scenes),
+            for idx, scene_data in enumerate(script_data.scenes, 1):
+                if scene_data.scene_number is None:
+                    scene_data.scene_number = idx
+            scenes = _scene_list_adapter.validate_python(
+                script_data.scenes, from_attributes=True
             )
 
+            # Summed once: the default total and the fallback after a mismatch
+            computed_duration = math.fsum(scene.duration_seconds for scene in scenes)
+            total_duration = script_data.total_duration_seconds
+            if total_duration is None:
+                total_duration = computed_duration
+
             video_script = VideoScript(
-                title=script_data["title"],
+                title=script_data.title,
                 scenes=scenes,
-                total_duration_seconds=float(total_duration),
+                total_duration_seconds=total_duration,
             )
 
             # Validate duration consistency
             if not video_script.validate_duration():
                 # Recalculate total duration from scenes
-                video_script.total_duration_seconds = sum(
-                    scene.duration_seconds for scene in scenes
-                )
-
-            return video_script
+                video_script.total_duration_seconds = computed_duration
 
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse LLM response as JSON: {e}") from e
-        except KeyError as e:
-            raise ValueError(f"Missing required field in generated script: {e}") from e
         except Exception as e:
             raise ValueError(f"Script generation failed: {e}") from e
 
+        # Only scripts that parsed successfully are cached
+        if cache_path is not None and cached_content is None:
+            self._write_cache(cache_path, json_content)
+
+        return video_script
+
+    def _cache_path(self, input_text: str) -> Path:
+        """
+        Get the cache file for an input, keyed by sha256(model || input_text).
+
+        Args:
+            input_text: Raw input text
+
+        Returns:
+            Path of the cached script JSON
+        """
+        model_id = getattr(self.llm_provider, "model_name", type(self.llm_provider).__name__)
+        key = hashlib.sha256(f"{model_id}\0{input_text}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _read_cache(cache_path: Path) -> str | None:
+        """
+        Read a cached script.
+
+        Args:
+            cache_path: Cache file to read
+
+        Returns:
+            Cached script JSON, or None on a cache miss
+        """
+        try:
+            return cache_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    @staticmethod
+    def _write_cache(cache_path: Path, json_content: str) -> None:
+        """
+        Store a script atomically; caching is best-effort and never fails generation.
+
+        Args:
+            cache_path: Cache file to write
+            json_content: Script JSON from the LLM provider
+        """
+        tmp_path = cache_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            ensure_directory(cache_path.parent)
+            tmp_path.write_text(json_content, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Failed to cache script: {e}")
+        finally:
+            tmp_path.unlink(missing_ok=True)
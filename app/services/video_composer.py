@@ -1,45 +1,72 @@
 """Video composer implementation using MoviePy."""
 
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-# MoviePy 2.x uses different import paths - try direct imports first
-try:
-    # MoviePy 2.x - direct imports
-    from moviepy import (
-        AudioFileClip,
-        CompositeVideoClip,
-        ImageClip,
-        TextClip,
-        concatenate_videoclips,
-    )
-except ImportError:
-    # Fallback for MoviePy 1.x - editor module
-    try:
-        from moviepy.editor import (
-            AudioFileClip,
-            CompositeVideoClip,
-            ImageClip,
-            TextClip,
-            concatenate_videoclips,
-        )
-    except ImportError:
-        # Last resort
-        raise ImportError(
-            "MoviePy is not properly installed. Please install with: pip install moviepy"
-        )
+import imageio_ffmpeg
+import numpy as np
 
+from app.core.config import ensure_directory
 from app.models.video_script import Scene, VideoScript
-from app.core.font_manager import FontManager
+from app.core.font_manager import get_font_path
+from app.services.ffmpeg_composer import AUDIO_CHANNELS, AUDIO_SAMPLE_RATE, concat_segments
+from app.services.scene_frame import render_scene_frame
+
+if TYPE_CHECKING:
+    from moviepy import ImageClip
+
+
+def _load_moviepy() -> tuple[Any, Any, Any, Any]:
+    """
+    Import MoviePy on first use.
+
+    MoviePy pulls in a large dependency stack, so it is only imported when a
+    video is actually composed; later calls hit the import cache.
+
+    Returns:
+        (AudioFileClip, AudioArrayClip, ImageClip, concatenate_audioclips)
+
+    Raises:
+        ImportError: If MoviePy is not installed
+    """
+    try:
+        # MoviePy 2.x - direct imports
+        from moviepy import AudioArrayClip, AudioFileClip, ImageClip, concatenate_audioclips
+    except ImportError:
+        # Fallback for MoviePy 1.x - editor module
+        try:
+            from moviepy.editor import (
+                AudioArrayClip,
+                AudioFileClip,
+                ImageClip,
+                concatenate_audioclips,
+            )
+        except ImportError:
+            raise ImportError(
+                "MoviePy is not properly installed. Please install with: pip install moviepy"
+            )
+    return AudioFileClip, AudioArrayClip, ImageClip, concatenate_audioclips
 
 
 class MoviePyVideoComposer:
-    """Video composer using MoviePy for rendering."""
+    """
+    Video composer using MoviePy for rendering.
+
+    MoviePy renders frames in Python under the GIL, so each scene is rendered
+    to its own segment in a separate process, and the segments are joined with
+    ffmpeg's concat demuxer (stream copy, no re-encode).
+    """
 
     def __init__(
         self,
         width: int = 1920,
         height: int = 1080,
         font_path: str | None = None,
+        max_workers: int | None = None,
     ):
         """
         Initialize MoviePyVideoComposer.
@@ -48,19 +75,21 @@ class MoviePyVideoComposer:
             width: Video width in pixels (default: 1920)
             height: Video height in pixels (default: 1080)
             font_path: Optional font path for subtitles
+            max_workers: Scenes rendered in parallel processes (default: CPU count)
         """
         self.width = width
         self.height = height
+        self.max_workers = max_workers or os.cpu_count() or 1
 
-        # Get font path
-        if font_path:
-            self.font_path = font_path
-        else:
-            font_manager = FontManager()
-            self.font_path = font_manager.get_font_path()
+        # Default font is resolved once per process
+        self.font_path = font_path or get_font_path()
 
     def compose(
-        self, script: VideoScript, output_path: Path, assets: dict[str, Path]
+        self,
+        script: VideoScript,
+        output_path: Path,
+        bg_assets: dict[int, Path | np.ndarray],
+        audio_assets: dict[int, Path],
     ) -> Path:
         """
         Compose video from script and assets.
@@ -68,8 +97,8 @@ class MoviePyVideoComposer:
         Args:
             script: VideoScript object containing scene definitions
             output_path: Path where output video should be saved
-            assets: Dictionary mapping scene numbers (as strings) to asset paths
-                   Expected keys: "audio_{scene_number}", "bg_{scene_number}"
+            bg_assets: Background image per scene number (path or in-memory RGB array)
+            audio_assets: Audio file per scene number; scenes without one are silent
 
         Returns:
             Path to generated video file
@@ -78,150 +107,143 @@ class MoviePyVideoComposer:
             Exception: If video composition fails
         """
         try:
-            # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if not script.scenes:
+                raise ValueError("No video clips generated from script")
+            for scene in script.scenes:
+                if scene.scene_number not in bg_assets:
+                    raise ValueError(
+                        f"Background asset not found for scene {scene.scene_number}"
+                    )
+
+            ensure_directory(output_path.parent)
+
+            workers = min(self.max_workers, len(script.scenes))
+            with tempfile.TemporaryDirectory(dir=output_path.parent) as work_dir:
+                segments = [
+                    Path(work_dir) / f"scene_{idx:04d}.mp4" for idx in range(len(script.scenes))
+                ]
+                # spawn: the API renders from a worker thread, and forking a
+                # threaded process can deadlock the children
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            self._render_scene,
+                            scene,
+                            bg_assets[scene.scene_number],
+                            audio_assets.get(scene.scene_number),
+                            segment,
+                            # Share the cores between the scene encoders
+                            max(1, (os.cpu_count() or 1) // workers),
+                        )
+                        for scene, segment in zip(script.scenes, segments)
+                    ]
+                    # result() propagates the first rendering error
+                    for future in futures:
+                        future.result()
+
+                concat_segments(imageio_ffmpeg.get_ffmpeg_exe(), segments, output_path)
 
-            # Build video clips for each scene
-            video_clips: list[CompositeVideoClip] = []
+            return output_path
 
-            for scene in script.scenes:
-                scene_clip = self._create_scene_clip(scene, assets)
-                video_clips.append(scene_clip)
+        except Exception as e:
+            raise RuntimeError(f"Failed to compose video: {e}") from e
 
-            # Concatenate all scenes
-            if not video_clips:
-                raise ValueError("No video clips generated from script")
+    def _render_scene(
+        self,
+        scene: Scene,
+        background: Path | np.ndarray,
+        audio_path: Path | None,
+        segment_path: Path,
+        threads: int,
+    ) -> Path:
+        """
+        Render a single scene to an MP4 segment (runs in a worker process).
 
-            final_video = concatenate_videoclips(video_clips, method="compose")
+        Args:
+            scene: Scene object
+            background: Background image path or RGB array
+            audio_path: Scene audio file, if any
+            segment_path: Where to write the segment
+            threads: Encoder threads for this segment
 
-            # Write video file
-            final_video.write_videofile(
-                str(output_path),
+        Returns:
+            Path to the rendered segment
+        """
+        scene_clip = self._create_scene_clip(scene, background, audio_path)
+        try:
+            scene_clip.write_videofile(
+                str(segment_path),
                 fps=24,
                 codec="libx264",
+                # Scenes are static stills: fast preset and stillimage tuning
+                preset="veryfast",
+                threads=threads,
+                ffmpeg_params=["-tune", "stillimage"],
                 audio_codec="aac",
-                temp_audiofile=str(output_path.parent / f"temp_audio_{output_path.stem}.m4a"),
-                remove_temp=True,
-                # MoviePy 2.x: verbose and logger parameters removed
+                audio_fps=AUDIO_SAMPLE_RATE,
+                # MoviePy always mixes audio to a temp file before muxing; keep
+                # it with the segments so it is cleaned up with them
+                temp_audiofile_path=str(segment_path.parent),
+                # Progress bars from parallel workers would interleave
+                logger=None,
             )
-
-            # Cleanup
-            final_video.close()
-            for clip in video_clips:
-                clip.close()
-
-            return output_path
-
-        except Exception as e:
-            raise RuntimeError(f"Failed to compose video: {e}") from e
+        finally:
+            scene_clip.close()
+        return segment_path
 
     def _create_scene_clip(
-        self, scene: Scene, assets: dict[str, Path]
-    ) -> CompositeVideoClip:
+        self, scene: Scene, background: Path | np.ndarray, audio_path: Path | None
+    ) -> "ImageClip":
         """
         Create a video clip for a single scene.
 
+        The subtitle is baked into the background once with Pillow, so the
+        scene is a single still ImageClip rather than a per-frame composite
+        of a background and a TextClip.
+
         Args:
             scene: Scene object
-            assets: Dictionary of asset paths
+            background: Background image path or RGB array
+            audio_path: Scene audio file, if any
 
         Returns:
-            CompositeVideoClip for the scene
+            ImageClip for the scene
         """
-        # Get background image
-        bg_key = f"bg_{scene.scene_number}"
-        if bg_key not in assets:
-            raise ValueError(f"Background asset not found for scene {scene.scene_number}")
+        AudioFileClip, AudioArrayClip, ImageClip, concatenate_audioclips = _load_moviepy()
 
-        bg_path = assets[bg_key]
-
-        # Create background clip with duration (MoviePy 2.x API)
-        bg_clip = ImageClip(str(bg_path), duration=scene.duration_seconds)
-        bg_clip = bg_clip.resized((self.width, self.height))
+        frame = render_scene_frame(
+            background, scene.display_text, self.width, self.height, self.font_path
+        )
 
-        # Create subtitle clip
-        subtitle_clip = self._create_subtitle_clip(scene, scene.duration_seconds)
+        # Create scene clip with duration (MoviePy 2.x API)
+        scene_clip = ImageClip(np.asarray(frame), duration=scene.duration_seconds)
 
         # Get audio clip if available
-        audio_key = f"audio_{scene.scene_number}"
         audio_clip = None
-        if audio_key in assets and assets[audio_key].exists():
+        if audio_path is not None and audio_path.exists():
             try:
-                audio_clip = AudioFileClip(str(assets[audio_key]))
+                audio_clip = AudioFileClip(str(audio_path))
                 # Adjust audio duration to match scene
                 if audio_clip.duration > scene.duration_seconds:
                     audio_clip = audio_clip.subclipped(0, scene.duration_seconds)  # MoviePy 2.x: subclip -> subclipped
                 elif audio_clip.duration < scene.duration_seconds:
                     # Loop audio if shorter than scene duration
                     loops = int(scene.duration_seconds / audio_clip.duration) + 1
-                    audio_clip = concatenate_videoclips(
+                    audio_clip = concatenate_audioclips(
                         [audio_clip] * loops
                     ).subclipped(0, scene.duration_seconds)  # MoviePy 2.x: subclip -> subclipped
-
-                bg_clip = bg_clip.with_audio(audio_clip)
             except Exception as e:
                 # If audio loading fails, continue without audio
                 print(f"Warning: Failed to load audio for scene {scene.scene_number}: {e}")
+                audio_clip = None
 
-        # Composite background and subtitle
-        composite = CompositeVideoClip([bg_clip, subtitle_clip])
-
-        return composite
-
-    def _create_subtitle_clip(
-        self, scene: Scene, duration: float
-    ) -> TextClip:
-        """
-        Create subtitle text clip for a scene.
-
-        Args:
-            scene: Scene object
-            duration: Clip duration in seconds
-
-        Returns:
-            TextClip for subtitles
-        """
-        try:
-            # Create text clip with font if available
-            text_params = {
-                "text": scene.display_text,  # MoviePy 2.x: txt -> text
-                "font_size": 70,  # MoviePy 2.x: fontsize -> font_size
-                "color": "white",
-                "method": "caption",
-                "size": (int(self.width * 0.8), None),  # MoviePy 2.x: width must be int
-                # MoviePy 2.x: align parameter removed, use with_position instead
-            }
-
-            # Only add font if it's a valid path
-            if self.font_path and Path(self.font_path).exists():
-                text_params["font"] = self.font_path
-
-            # Add duration to text_params for MoviePy 2.x API
-            text_params["duration"] = duration
-            subtitle_clip = TextClip(**text_params)
-            # MoviePy 2.x: with_margin() removed, use position with offset instead
-            subtitle_clip = subtitle_clip.with_position(
-                ("center", self.height - int(self.height * 0.1))
+        if audio_clip is None:
+            # Silence keeps every segment's streams identical for the concat copy
+            samples = max(1, round(scene.duration_seconds * AUDIO_SAMPLE_RATE))
+            audio_clip = AudioArrayClip(
+                np.zeros((samples, AUDIO_CHANNELS)), fps=AUDIO_SAMPLE_RATE
             )
 
-            return subtitle_clip
-
-        except Exception as e:
-            # Fallback: create simple text clip without font
-            print(f"Warning: Failed to create subtitle with font: {e}")
-            subtitle_clip = TextClip(
-                scene.display_text,
-                font_size=50,  # MoviePy 2.x: fontsize -> font_size
-                color="white",
-                size=(int(self.width * 0.8), None),  # MoviePy 2.x: width must be int
-                method="caption",
-                # MoviePy 2.x: align parameter removed, use with_position instead
-                duration=duration,  # MoviePy 2.x API
-            )
-            # MoviePy 2.x: with_margin() removed, use position with offset instead
-            subtitle_clip = subtitle_clip.with_position(
-                ("center", self.height - int(self.height * 0.1))
-            )
-
-            return subtitle_clip
-
+        return scene_clip.with_audio(audio_clip)
@@ -1,15 +1,19 @@
 """Video generator service that orchestrates the entire video generation process."""
 
+import tempfile
+from collections.abc import Callable
 from pathlib import Path
 
-from app.core.config import get_settings
+import numpy as np
+
+from app.core.config import ensure_directory, get_settings
 from app.interfaces.llm_provider import LLMProvider
 from app.interfaces.asset_manager import AssetManager
 from app.interfaces.video_composer import VideoComposer
-from app.services.llm_provider import MockLLMProvider, OpenAILLMProvider
+from app.services.llm_provider import MockLLMProvider, get_openai_provider
 from app.services.script_generator import ScriptGenerator
 from app.services.asset_manager import SimpleAssetManager
-from app.services.video_composer import MoviePyVideoComposer
+from app.services.ffmpeg_composer import FFmpegVideoComposer
 
 
 def generate_video_from_text(
@@ -21,6 +25,7 @@ def generate_video_from_text(
     use_mock_llm: bool = True,
     width: int = 1920,
     height: int = 1080,
+    progress_callback: Callable[[str, float], None] | None = None,
 ) -> Path:
     """
     Generate video from input text.
@@ -30,10 +35,12 @@ def generate_video_from_text(
         output_path: Path where output video will be saved
         llm_provider: Optional LLM provider (default: MockLLMProvider or OpenAILLMProvider)
         asset_manager: Optional asset manager (default: SimpleAssetManager)
-        video_composer: Optional video composer (default: MoviePyVideoComposer)
+        video_composer: Optional video composer (default: FFmpegVideoComposer)
         use_mock_llm: Whether to use mock LLM if provider not specified (default: True)
         width: Video width in pixels (default: 1920)
         height: Video height in pixels (default: 1080)
+        progress_callback: Optional callback receiving (stage, progress) as each
+                           pipeline stage completes; progress is in [0.0, 1.0]
 
     Returns:
         Path to generated video file
@@ -43,13 +50,17 @@ def generate_video_from_text(
     """
     settings = get_settings()
 
+    def report(stage: str, progress: float) -> None:
+        if progress_callback is not None:
+            progress_callback(stage, progress)
+
     # Initialize components if not provided
     if llm_provider is None:
         if use_mock_llm:
             llm_provider = MockLLMProvider()
         else:
             try:
-                llm_provider = OpenAILLMProvider()
+                llm_provider = get_openai_provider()
             except ValueError as e:
                 print(f"Warning: Failed to initialize OpenAI LLM: {e}")
                 print("Falling back to Mock LLM provider")
@@ -59,7 +70,7 @@ def generate_video_from_text(
         asset_manager = SimpleAssetManager(output_dir=settings.temp_directory)
 
     if video_composer is None:
-        video_composer = MoviePyVideoComposer(width=width, height=height)
+        video_composer = FFmpegVideoComposer(width=width, height=height)
 
     # Step 1: Generate script
     print("Generating video script...")
@@ -71,55 +82,81 @@ def generate_video_from_text(
         print(f"  Total duration: {video_script.total_duration_seconds:.1f}s")
     except Exception as e:
         raise RuntimeError(f"Script generation failed: {e}") from e
+    report("script", 0.2)
 
     # Step 2: Generate assets
     print("\nGenerating assets...")
-    assets: dict[str, Path] = {}
-
-    for scene in video_script.scenes:
-        scene_num = scene.scene_number
-        print(f"  Processing scene {scene_num}...")
+    bg_assets: dict[int, Path | np.ndarray] = {}
+    audio_assets: dict[int, Path] = {}
+    scenes = video_script.scenes
 
-        # Generate background image
+    # Backgrounds are rendered in memory; fail the video if any is missing
+    backgrounds: list[Path | np.ndarray] = []
+    for scene in scenes:
         try:
-            bg_path = asset_manager.get_background_image(
-                width=width,
-                height=height,
-                scene_number=scene_num,
-                color=scene.background_color,
+            backgrounds.append(
+                asset_manager.get_background_image(
+                    width=width,
+                    height=height,
+                    scene_number=scene.scene_number,
+                    color=scene.background_color,
+                )
             )
-            assets[f"bg_{scene_num}"] = bg_path
-            print(f"    ✓ Background image: {bg_path.name}")
         except Exception as e:
             raise RuntimeError(
-                f"Failed to generate background for scene {scene_num}: {e}"
+                f"Failed to generate background for scene {scene.scene_number}: {e}"
             ) from e
 
-        # Generate audio
+    # Each generation writes its audio to its own directory: concurrent jobs
+    # use the same scene numbers and must not overwrite each other's files
+    with tempfile.TemporaryDirectory(
+        prefix="audio_", dir=ensure_directory(settings.temp_directory)
+    ) as audio_tmp:
+        audio_dir = Path(audio_tmp)
+
+        # All scene audio in one batch; a failed scene just has no audio
+        audio_results = asset_manager.generate_audio_batch(
+            [
+                (scene.dialogue, audio_dir / f"audio_scene_{scene.scene_number}.mp3", "ja")
+                for scene in scenes
+            ],
+            return_exceptions=True,
+        )
+
+        for idx, (scene, background, audio_result) in enumerate(
+            zip(scenes, backgrounds, audio_results), 1
+        ):
+            scene_num = scene.scene_number
+            print(f"  Scene {scene_num}:")
+
+            bg_assets[scene_num] = background
+            if isinstance(background, Path):
+                print(f"    ✓ Background image: {background.name}")
+            else:
+                print("    ✓ Background image (in memory)")
+
+            if isinstance(audio_result, BaseException):
+                # Continue without audio for this scene
+                print(f"    ⚠ Failed to generate audio for scene {scene_num}: {audio_result}")
+            else:
+                audio_assets[scene_num] = audio_result
+                print(f"    ✓ Audio: {audio_result.name}")
+
+            report("assets", 0.2 + 0.5 * idx / len(scenes))
+
+        # Step 3: Compose video
+        print("\nComposing video...")
         try:
-            audio_path = settings.temp_directory / f"audio_scene_{scene_num}.mp3"
-            asset_manager.generate_audio(
-                text=scene.dialogue,
-                output_path=audio_path,
-                language="ja",
+            video_path = video_composer.compose(
+                script=video_script,
+                output_path=output_path,
+                bg_assets=bg_assets,
+                audio_assets=audio_assets,
             )
-            assets[f"audio_{scene_num}"] = audio_path
-            print(f"    ✓ Audio: {audio_path.name}")
+            print(f"✓ Video generated: {video_path}")
         except Exception as e:
-            print(f"    ⚠ Failed to generate audio for scene {scene_num}: {e}")
-            # Continue without audio for this scene
-
-    # Step 3: Compose video
-    print("\nComposing video...")
-    try:
-        video_path = video_composer.compose(
-            script=video_script,
-            output_path=output_path,
-            assets=assets,
-        )
-        print(f"✓ Video generated: {video_path}")
-    except Exception as e:
-        raise RuntimeError(f"Video composition failed: {e}") from e
+            raise RuntimeError(f"Video composition failed: {e}") from e
+        report("compose", 1.0)
 
     return video_path
 
@@ -0,0 +1,164 @@
+"""Celery application and background tasks for video generation.
+
+Workers consume from queues matched to their hardware:
+- video_generation: Default queue for jobs without a specific route
+- openai_queue: Jobs that call the OpenAI API (hosts with API keys)
+- render_queue: Mock-LLM jobs that only need ffmpeg/MoviePy
+
+Start a worker with:
+    celery -A app.tasks worker -Q video_generation,openai_queue,render_queue
+"""
+
+import os
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from celery import Celery
+from celery.signals import worker_process_init, worker_ready
+from kombu import Exchange, Queue
+
+from app.core.config import ensure_directory, get_settings
+from app.core.font_manager import warm_up_fonts
+from app.services.video_generator import generate_video_from_text
+
+settings = get_settings()
+
+celery_app = Celery(
+    "story_to_reel",
+    broker=settings.broker_url,
+    backend=settings.result_backend,
+)
+
+video_exchange = Exchange("video", type="direct")
+
+
+def route_video_task(
+    name: str, args: tuple, kwargs: dict[str, Any], options: dict[str, Any], task=None, **kw
+) -> dict[str, str] | None:
+    """
+    Route video generation jobs to the queue matching their requirements.
+
+    Args:
+        name: Task name
+        args: Positional task arguments
+        kwargs: Keyword task arguments
+        options: Task execution options
+
+    Returns:
+        Routing options, or None to fall back to the default route
+    """
+    if name != "generate_video":
+        return None
+    if kwargs.get("use_mock_llm", True):
+        return {"queue": "render_queue", "routing_key": "video.render"}
+    return {"queue": "openai_queue", "routing_key": "video.openai"}
+
+
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    # Long video jobs: acknowledge after completion and fetch one job at a time
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    task_track_started=True,
+    task_default_queue="video_generation",
+    task_default_exchange="video",
+    task_default_routing_key="video.generate",
+    task_queues=(
+        Queue("video_generation", video_exchange, routing_key="video.generate"),
+        Queue("openai_queue", video_exchange, routing_key="video.openai"),
+        Queue("render_queue", video_exchange, routing_key="video.render"),
+    ),
+    task_routes=(route_video_task,),
+)
+
+
+@worker_process_init.connect
+@worker_ready.connect
+def warm_up_worker(**kwargs: Any) -> None:
+    """
+    Preload fonts and PIL before a worker takes its first job.
+
+    With the prefork pool, worker_ready only fires in the main process after
+    the pool has forked, so each child process warms up on worker_process_init.
+    worker_ready covers the solo and thread pools, which run jobs in-process.
+    """
+    warm_up_fonts()
+
+
+def render_video(
+    input_text: str,
+    output_path: Path,
+    use_mock_llm: bool = True,
+    width: int = 1920,
+    height: int = 1080,
+    progress_callback: Callable[[str, float], None] | None = None,
+) -> Path:
+    """
+    Generate video and move it into place atomically.
+
+    The video is rendered to a unique temp file and renamed, so output_path only
+    ever holds a complete video even when duplicate requests run concurrently.
+
+    Args:
+        input_text: Text to convert to video
+        output_path: Path where output video will be saved
+        use_mock_llm: Whether to use mock LLM provider (default: True)
+        width: Video width in pixels (default: 1920)
+        height: Video height in pixels (default: 1080)
+        progress_callback: Optional (stage, progress) callback for pipeline progress
+
+    Returns:
+        Path to generated video file
+    """
+    # Workers start without the API lifespan, so the directory may not exist yet
+    ensure_directory(output_path.parent)
+    tmp_path = output_path.with_name(f"{output_path.stem}.{uuid.uuid4().hex}{output_path.suffix}")
+    try:
+        video_path = generate_video_from_text(
+            input_text=input_text,
+            output_path=tmp_path,
+            use_mock_llm=use_mock_llm,
+            width=width,
+            height=height,
+            progress_callback=progress_callback,
+        )
+        os.replace(video_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return output_path
+
+
+@celery_app.task(name="generate_video")
+def generate_video_task(
+    input_text: str,
+    output_path: str,
+    use_mock_llm: bool = True,
+    width: int = 1920,
+    height: int = 1080,
+) -> str:
+    """
+    Generate video from input text in a Celery worker.
+
+    Args:
+        input_text: Text to convert to video
+        output_path: Path where output video will be saved
+        use_mock_llm: Whether to use mock LLM provider (default: True)
+        width: Video width in pixels (default: 1920)
+        height: Video height in pixels (default: 1080)
+
+    Returns:
+        Path to generated video file as string
+    """
+    video_path = render_video(
+        input_text=input_text,
+        output_path=Path(output_path),
+        use_mock_llm=use_mock_llm,
+        width=width,
+        height=height,
+    )
+    return str(video_path)
@@ -1,18 +1,65 @@
 """Pytest configuration and shared fixtures."""
 
-import json
+import re
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import gtts
+import orjson
 import pytest
 
 from app.models.video_script import Scene, VideoScript
 
+if TYPE_CHECKING:
+    # Service modules pull in the whole app graph; fixtures import them lazily
+    from app.services.llm_provider import MockLLMProvider
+
+
+class FakeTTS:
+    """Offline stand-in for gTTS: writes a stub MP3 and logs constructor arguments."""
+
+    calls: list[dict[str, Any]] = []
+
+    def __init__(self, **kwargs: Any):
+        FakeTTS.calls.append(kwargs)
+
+    def save(self, path: str) -> None:
+        Path(path).write_bytes(b"ID3")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _stub_gtts():
+    """Replace gTTS for the whole session so no test reaches the network."""
+    with pytest.MonkeyPatch.context() as mp:
+        # Modules importing gTTS from now on get the stub; patch the asset
+        # manager directly only if a test module has already imported it
+        mp.setattr(gtts, "gTTS", FakeTTS)
+        asset_manager = sys.modules.get("app.services.asset_manager")
+        if asset_manager is not None:
+            mp.setattr(asset_manager, "gTTS", FakeTTS)
+        yield
+
 
 @pytest.fixture
-def temp_dir(tmp_path: Path) -> Path:
-    """Create temporary directory for test outputs."""
-    test_dir = tmp_path / "test_output"
-    test_dir.mkdir(parents=True, exist_ok=True)
+def fake_tts() -> type[FakeTTS]:
+    """Return the gTTS stub with an empty call log."""
+    FakeTTS.calls.clear()
+    return FakeTTS
+
+
+@pytest.fixture(scope="session")
+def _session_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one temporary root shared by the whole test session."""
+    return tmp_path_factory.mktemp("suite")
+
+
+@pytest.fixture
+def temp_dir(_session_tmp: Path, request: pytest.FixtureRequest) -> Path:
+    """Create an empty directory for test outputs under the session root."""
+    # Node IDs are unique across modules, unlike bare test names
+    test_dir = _session_tmp / re.sub(r"\W", "_", request.node.nodeid)
+    test_dir.mkdir()
     return test_dir
 
 
@@ -38,9 +85,9 @@ def sample_video_script(sample_scene: Scene) -> VideoScript:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_llm_json_response() -> str:
-    """Return a mock JSON response from LLM provider."""
+    """Return a mock JSON response from LLM provider (serialized once per session)."""
     script_data = {
         "title": "Test Story",
         "scenes": [
@@ -61,7 +108,15 @@ def mock_llm_json_response() -> str:
         ],
         "total_duration_seconds": 4.5,
     }
-    return json.dumps(script_data, ensure_ascii=False)
+    return orjson.dumps(script_data).decode()
+
+
+@pytest.fixture(scope="session")
+def mock_llm() -> "MockLLMProvider":
+    """Return one MockLLMProvider shared by the session (its output is memoized per input)."""
+    from app.services.llm_provider import MockLLMProvider
+
+    return MockLLMProvider()
 
 
 @pytest.fixture
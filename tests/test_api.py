@@ -0,0 +1,403 @@
+"""Tests for FastAPI endpoints."""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.main import app
+from app.api.rate_limit import limiter
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Create a test client for the API."""
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """Start every test with empty rate limit counters."""
+    limiter.reset()
+
+
+class TestLifespan:
+    """Tests for application startup."""
+
+    def test_startup_creates_directories(self, temp_dir, monkeypatch):
+        """Test that output and temp directories are created at startup."""
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        monkeypatch.setattr(settings, "output_directory", temp_dir / "output")
+        monkeypatch.setattr(settings, "temp_directory", temp_dir / "temp")
+
+        with TestClient(app):
+            assert settings.output_directory.is_dir()
+            assert settings.temp_directory.is_dir()
+
+
+class TestGenerateEndpoint:
+    """Tests for POST /api/v1/generate."""
+
+    @patch("app.api.endpoints.generate_video_task")
+    def test_generate_enqueues_task(self, mock_task, client: TestClient):
+        """Test that generate enqueues a Celery task and returns immediately."""
+        mock_task.apply_async.return_value = Mock(id="task-123")
+
+        response = client.post(
+            "/api/v1/generate",
+            json={"input_text": "This is a test.", "width": 640, "height": 360},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "processing"
+        assert data["task_id"] == "task-123"
+
+        kwargs = mock_task.apply_async.call_args.kwargs["kwargs"]
+        assert kwargs["input_text"] == "This is a test."
+        assert kwargs["width"] == 640
+        assert kwargs["output_path"].endswith(".mp4")
+
+    @patch("app.api.endpoints.generate_video_task")
+    def test_generate_returns_existing_video(
+        self, mock_task, client: TestClient, temp_dir, monkeypatch
+    ):
+        """Test that identical requests reuse an already generated video."""
+        from app.core.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "output_directory", temp_dir)
+        mock_task.apply_async.return_value = Mock(id="task-123")
+        payload = {"input_text": "Cached text."}
+
+        client.post("/api/v1/generate", json=payload)
+        output_path = mock_task.apply_async.call_args.kwargs["kwargs"]["output_path"]
+        Path(output_path).touch()
+
+        data = client.post("/api/v1/generate", json=payload).json()
+
+        assert data["status"] == "completed"
+        assert data["video_path"] == output_path
+        mock_task.apply_async.assert_called_once()
+
+    @patch("app.api.endpoints.generate_video_task")
+    def test_generate_broker_unavailable(self, mock_task, client: TestClient):
+        """Test that broker errors are reported as 503."""
+        mock_task.apply_async.side_effect = ConnectionError("broker down")
+
+        response = client.post("/api/v1/generate", json={"input_text": "Test"})
+
+        assert response.status_code == 503
+
+    @patch("app.api.endpoints.generate_video_task")
+    def test_generate_rate_limited(self, mock_task, client: TestClient, monkeypatch):
+        """Test that clients over the generate limit get 429 with Retry-After."""
+        from app.core.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "generate_rate_limit", "2/minute")
+        mock_task.apply_async.return_value = Mock(id="task-123")
+
+        statuses = [
+            client.post("/api/v1/generate", json={"input_text": f"Test {i}"}).status_code
+            for i in range(3)
+        ]
+
+        assert statuses == [200, 200, 429]
+        response = client.post("/api/v1/generate", json={"input_text": "Test"})
+        assert response.headers["retry-after"] == "60"
+
+    def test_generate_rejects_invalid_dimensions(self, client: TestClient):
+        """Test that out-of-range dimensions fail validation with 422."""
+        response = client.post("/api/v1/generate", json={"input_text": "Test", "width": 100})
+
+        assert response.status_code == 422
+
+
+class TestGenerateInProcess:
+    """Tests for POST /api/v1/generate with the task queue disabled."""
+
+    @pytest.fixture(autouse=True)
+    def in_process_settings(self, temp_dir, monkeypatch):
+        """Disable the task queue and write videos to the temp directory."""
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        monkeypatch.setattr(settings, "use_task_queue", False)
+        monkeypatch.setattr(settings, "output_directory", temp_dir)
+        return settings
+
+    @patch("app.api.endpoints.render_video")
+    def test_generate_renders_in_thread(self, mock_render, client: TestClient):
+        """Test that generation runs in-process and returns the video path."""
+        mock_render.side_effect = lambda output_path, **kwargs: output_path
+
+        data = client.post("/api/v1/generate", json={"input_text": "Test"}).json()
+
+        assert data["status"] == "completed"
+        assert data["video_path"].endswith(".mp4")
+        mock_render.assert_called_once()
+
+    @patch("app.api.endpoints.render_video")
+    def test_generate_rejects_when_saturated(
+        self, mock_render, client: TestClient, in_process_settings, monkeypatch
+    ):
+        """Test that a saturated generator fails fast with 503 and Retry-After."""
+        monkeypatch.setattr(in_process_settings, "max_queued_generations", 0)
+        monkeypatch.setattr("app.api.endpoints._generation_semaphore", asyncio.Semaphore(0))
+
+        response = client.post("/api/v1/generate", json={"input_text": "Test"})
+
+        assert response.status_code == 503
+        assert "retry-after" in response.headers
+        mock_render.assert_not_called()
+
+
+class TestGenerateStreamEndpoint:
+    """Tests for GET /api/v1/generate/stream."""
+
+    @pytest.fixture(autouse=True)
+    def output_dir(self, temp_dir, monkeypatch):
+        """Write videos to the temp directory."""
+        from app.core.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "output_directory", temp_dir)
+
+    @staticmethod
+    def _events(response) -> list[dict]:
+        return [
+            json.loads(line[len("data: "):])
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+
+    @patch("app.api.endpoints.render_video")
+    def test_stream_emits_progress_then_result(self, mock_render, client: TestClient):
+        """Test that progress events precede the completion event."""
+
+        def fake_render(output_path, progress_callback, **kwargs):
+            progress_callback("script", 0.2)
+            progress_callback("compose", 1.0)
+            return output_path
+
+        mock_render.side_effect = fake_render
+
+        response = client.get("/api/v1/generate/stream", params={"input_text": "Test"})
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = self._events(response)
+        assert [e.get("stage") for e in events[:-1]] == ["script", "compose"]
+        assert events[-1]["status"] == "completed"
+        assert events[-1]["video_path"].endswith(".mp4")
+
+    @patch("app.api.endpoints.render_video")
+    def test_stream_reports_failure(self, mock_render, client: TestClient):
+        """Test that pipeline errors are sent as a failed event."""
+        mock_render.side_effect = RuntimeError("boom")
+
+        response = client.get("/api/v1/generate/stream", params={"input_text": "Test"})
+
+        events = self._events(response)
+        assert events[-1]["status"] == "failed"
+        assert "boom" in events[-1]["message"]
+
+    async def test_stream_disconnect_keeps_render_and_logs_failure(
+        self, temp_dir, monkeypatch, caplog
+    ):
+        """Test that a render outlives its disconnected client and its failure is logged."""
+        from app.api import endpoints
+
+        release = asyncio.Event()
+
+        async def fake_render(request, output_path, progress_callback):
+            progress_callback("script", 0.2)
+            await release.wait()
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(endpoints, "_render_in_process", fake_render)
+        request = endpoints.VideoGenerationRequest(input_text="Test")
+        stream = endpoints._generation_events(request, temp_dir / "out.mp4")
+
+        assert json.loads((await anext(stream))[len("data: "):])["stage"] == "script"
+        await stream.aclose()
+
+        (task,) = endpoints._background_tasks
+        release.set()
+        with pytest.raises(RuntimeError):
+            await task
+        await asyncio.sleep(0)
+
+        assert not endpoints._background_tasks
+        assert "failed after the client disconnected" in caplog.text
+
+    def test_stream_rejects_invalid_dimensions(self, client: TestClient):
+        """Test that query parameters are validated like the request body."""
+        response = client.get(
+            "/api/v1/generate/stream", params={"input_text": "Test", "height": 100}
+        )
+
+        assert response.status_code == 422
+
+
+class TestTaskStatusEndpoint:
+    """Tests for GET /api/v1/task/{task_id}."""
+
+    @patch("app.api.endpoints.AsyncResult")
+    def test_task_completed(self, mock_result_cls, client: TestClient):
+        """Test status of a completed task."""
+        mock_result_cls.return_value = Mock(
+            successful=Mock(return_value=True), result="output/video.mp4"
+        )
+
+        data = client.get("/api/v1/task/task-123").json()
+
+        assert data["status"] == "completed"
+        assert data["video_path"] == "output/video.mp4"
+
+    @patch("app.api.endpoints.AsyncResult")
+    def test_task_failed(self, mock_result_cls, client: TestClient):
+        """Test status of a failed task."""
+        mock_result_cls.return_value = Mock(
+            successful=Mock(return_value=False),
+            failed=Mock(return_value=True),
+            result=RuntimeError("boom"),
+        )
+
+        data = client.get("/api/v1/task/task-123").json()
+
+        assert data["status"] == "failed"
+        assert "boom" in data["message"]
+
+    @patch("app.api.endpoints.AsyncResult")
+    def test_task_processing(self, mock_result_cls, client: TestClient):
+        """Test status of a pending task."""
+        mock_result_cls.return_value = Mock(
+            successful=Mock(return_value=False), failed=Mock(return_value=False)
+        )
+
+        data = client.get("/api/v1/task/task-123").json()
+
+        assert data["status"] == "processing"
+        assert data["video_path"] is None
+
+
+class TestTasks:
+    """Tests for Celery task routing and execution."""
+
+    def test_openai_jobs_use_openai_queue(self):
+        """Test that OpenAI jobs are routed to the OpenAI queue."""
+        from app.tasks import route_video_task
+
+        route = route_video_task("generate_video", (), {"use_mock_llm": False}, {})
+        assert route["queue"] == "openai_queue"
+
+    def test_mock_jobs_use_render_queue(self):
+        """Test that mock-LLM jobs are routed to the render queue."""
+        from app.tasks import route_video_task
+
+        route = route_video_task("generate_video", (), {"use_mock_llm": True}, {})
+        assert route["queue"] == "render_queue"
+
+    @pytest.mark.parametrize("signal_name", ["worker_process_init", "worker_ready"])
+    def test_worker_warm_up_runs_in_pool_processes(self, signal_name):
+        """Test that fonts are warmed in each prefork child as well as in-process pools."""
+        from celery import signals
+
+        with patch("app.tasks.warm_up_fonts") as mock_warm_up:
+            getattr(signals, signal_name).send(sender=None)
+
+        mock_warm_up.assert_called_once()
+
+    def test_task_renames_completed_video(self, temp_dir):
+        """Test that the task renders to a temp file and renames it into place."""
+        from app.tasks import generate_video_task
+
+        def fake_generate(output_path, **kwargs):
+            output_path.write_bytes(b"video")
+            return output_path
+
+        final_path = temp_dir / "video_abc.mp4"
+        with patch("app.tasks.generate_video_from_text", side_effect=fake_generate) as mock_gen:
+            result = generate_video_task(input_text="Test", output_path=str(final_path))
+
+        assert result == str(final_path)
+        assert final_path.read_bytes() == b"video"
+        assert mock_gen.call_args.kwargs["output_path"] != final_path
+        assert list(temp_dir.iterdir()) == [final_path]
+
+    def test_task_creates_output_directory(self, temp_dir):
+        """Test that a standalone worker creates the output directory itself."""
+        from app.tasks import generate_video_task
+
+        def fake_generate(output_path, **kwargs):
+            output_path.write_bytes(b"video")
+            return output_path
+
+        final_path = temp_dir / "output" / "video_abc.mp4"
+        with patch("app.tasks.generate_video_from_text", side_effect=fake_generate):
+            generate_video_task(input_text="Test", output_path=str(final_path))
+
+        assert final_path.read_bytes() == b"video"
+
+
+class TestVideoEndpoint:
+    """Tests for GET /api/v1/video/{filename}."""
+
+    @pytest.fixture
+    def video_file(self, temp_dir, monkeypatch):
+        """Create a fake video file in the output directory."""
+        from app.core.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "output_directory", temp_dir)
+        video_path = temp_dir / "video_test.mp4"
+        video_path.write_bytes(bytes(range(256)) * 4)
+        return video_path
+
+    def test_get_video_returns_file(self, client: TestClient, video_file):
+        """Test that the full file is returned with range support advertised."""
+        response = client.get(f"/api/v1/video/{video_file.name}")
+
+        assert response.status_code == 200
+        assert response.content == video_file.read_bytes()
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-length"] == "1024"
+
+    def test_get_video_range_request(self, client: TestClient, video_file):
+        """Test that Range requests return partial content."""
+        response = client.get(
+            f"/api/v1/video/{video_file.name}", headers={"Range": "bytes=10-19"}
+        )
+
+        assert response.status_code == 206
+        assert response.content == video_file.read_bytes()[10:20]
+        assert response.headers["content-range"] == "bytes 10-19/1024"
+
+    def test_get_video_conditional_request(self, client: TestClient, video_file):
+        """Test that a matching If-None-Match returns 304 without a body."""
+        etag = client.get(f"/api/v1/video/{video_file.name}").headers["etag"]
+
+        response = client.get(
+            f"/api/v1/video/{video_file.name}", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_get_video_stale_etag(self, client: TestClient, video_file):
+        """Test that a non-matching If-None-Match returns the full file."""
+        response = client.get(
+            f"/api/v1/video/{video_file.name}", headers={"If-None-Match": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.content == video_file.read_bytes()
+
+    def test_get_video_not_found(self, client: TestClient, video_file):
+        """Test that missing files return 404."""
+        response = client.get("/api/v1/video/missing.mp4")
+
+        assert response.status_code == 404
@@ -1,40 +1,76 @@
 """Tests for AssetManager service."""
 
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from app.services.asset_manager import SimpleAssetManager
 
 
+@pytest.fixture(autouse=True)
+def _fast_png(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Write a PNG signature instead of encoding images, unless the test is marked slow."""
+    if request.node.get_closest_marker("slow"):
+        return
+    monkeypatch.setattr(
+        "PIL.Image.Image.save",
+        lambda self, fp, *args, **kwargs: Path(fp).write_bytes(b"\x89PNG"),
+    )
+
+
+@pytest.fixture(scope="class")
+def manager(tmp_path_factory: pytest.TempPathFactory) -> SimpleAssetManager:
+    """Create one manager shared by the class, writing to its own directory."""
+    return SimpleAssetManager(output_dir=tmp_path_factory.mktemp("assets"))
+
+
+@pytest.mark.xdist_group(name="assets")
 class TestSimpleAssetManager:
     """Tests for SimpleAssetManager."""
 
-    def test_get_background_image_creates_file(self, temp_dir: Path):
-        """Test that get_background_image creates an image file."""
-        manager = SimpleAssetManager(output_dir=temp_dir)
+    def test_get_background_image_returns_array(self, manager: SimpleAssetManager):
+        """Test that get_background_image returns an in-memory RGB array by default."""
+        before = set(manager.output_dir.iterdir())
+        image = manager.get_background_image(
+            width=200, height=100, scene_number=1, color="#FF0000"
+        )
+
+        assert isinstance(image, np.ndarray)
+        assert image.shape == (100, 200, 3)
+        assert tuple(image[1, 1]) == (255, 0, 0)
+        assert not image.flags.writeable
+        assert set(manager.output_dir.iterdir()) == before
+
+    def test_get_background_image_creates_file(self, manager: SimpleAssetManager):
+        """Test that get_background_image creates an image file when persisting."""
         image_path = manager.get_background_image(
-            width=1920, height=1080, scene_number=1, color="#FF0000"
+            width=1920, height=1080, scene_number=2, color="#FF0000", persist=True
         )
 
         assert image_path.exists()
         assert image_path.suffix == ".png"
 
-    def test_get_background_image_uses_scene_number_in_path(self, temp_dir: Path):
-        """Test that background image path includes scene number."""
-        manager = SimpleAssetManager(output_dir=temp_dir)
-        image_path = manager.get_background_image(
-            width=1920, height=1080, scene_number=5
+    def test_get_background_image_reuses_cached_file(self, manager: SimpleAssetManager):
+        """Test that identical parameters return the same cached file."""
+        path1 = manager.get_background_image(
+            width=1920, height=1080, scene_number=3, color="#123456", persist=True
+        )
+        path2 = manager.get_background_image(
+            width=1920, height=1080, scene_number=4, color="#123456", persist=True
         )
 
-        assert "scene_5" in str(image_path)
+        assert path1 == path2
+        assert list(manager.output_dir.glob("*.tmp")) == []
 
+    @pytest.mark.slow
     def test_get_background_image_with_custom_color(self, temp_dir: Path):
         """Test background image generation with custom color."""
+        # Own directory: the shared manager's cache holds stubbed PNGs from fast tests
         manager = SimpleAssetManager(output_dir=temp_dir)
         image_path = manager.get_background_image(
-            width=100, height=100, scene_number=1, color="#00FF00"
+            width=100, height=100, scene_number=5, color="#00FF00", persist=True
         )
 
         assert image_path.exists()
@@ -43,65 +79,91 @@ class TestSimpleAssetManager:
         img = Image.open(image_path)
         assert img.size == (100, 100)
 
-    def test_get_background_image_generates_variation_by_scene(self, temp_dir: Path):
+    def test_get_background_image_generates_variation_by_scene(
+        self, manager: SimpleAssetManager
+    ):
         """Test that different scene numbers generate different images."""
-        manager = SimpleAssetManager(output_dir=temp_dir)
-        path1 = manager.get_background_image(100, 100, scene_number=1)
-        path2 = manager.get_background_image(100, 100, scene_number=2)
+        image1 = manager.get_background_image(100, 100, scene_number=1)
+        image2 = manager.get_background_image(100, 100, scene_number=2)
 
-        assert path1 != path2
+        assert not np.array_equal(image1, image2)
 
-    @patch("app.services.asset_manager.gTTS")
-    def test_generate_audio_creates_file(self, mock_gtts, temp_dir: Path):
+    def test_generate_audio_creates_file(
+        self, fake_tts, manager: SimpleAssetManager, temp_dir: Path
+    ):
         """Test that generate_audio creates an audio file."""
-        # Mock gTTS
-        mock_tts_instance = Mock()
-        mock_gtts.return_value = mock_tts_instance
-
-        manager = SimpleAssetManager(output_dir=temp_dir)
         audio_path = temp_dir / "test_audio.mp3"
 
-        # Create a temporary file to simulate gTTS save
-        audio_path.touch()
+        result_path = manager.generate_audio("Test text", audio_path, language="ja")
+
+        assert result_path.exists()
+        assert fake_tts.calls == [{"text": "Test text", "lang": "ja", "slow": False}]
+
+    def test_generate_audio_batch_creates_files(
+        self, fake_tts, manager: SimpleAssetManager, temp_dir: Path
+    ):
+        """Test that generate_audio_batch creates all files in order."""
+        items = [(f"Text {i}", temp_dir / f"audio_{i}.mp3", "ja") for i in range(3)]
+
+        result = manager.generate_audio_batch(items)
+
+        assert result == [path for _, path, _ in items]
+        assert all(path.exists() for path in result)
+        assert len(fake_tts.calls) == 3
 
-        # Mock the save method to create the file
-        def mock_save(path):
+    @patch("app.services.asset_manager.gTTS")
+    def test_generate_audio_batch_returns_exceptions(
+        self, mock_gtts, manager: SimpleAssetManager, temp_dir: Path
+    ):
+        """Test that return_exceptions reports failures in place of paths."""
+        def save(path):
+            if "audio_1" in path:
+                raise ConnectionError("TTS unavailable")
             Path(path).touch()
 
-        mock_tts_instance.save = mock_save
+        mock_gtts.return_value.save.side_effect = save
 
-        result_path = manager.generate_audio("Test text", audio_path, language="ja")
+        items = [(f"Text {i}", temp_dir / f"audio_{i}.mp3", "ja") for i in range(3)]
 
-        assert result_path.exists()
-        mock_gtts.assert_called_once_with(text="Test text", lang="ja", slow=False)
+        result = manager.generate_audio_batch(items, return_exceptions=True)
+
+        assert result[0] == items[0][1]
+        assert isinstance(result[1], RuntimeError)
+        assert result[2] == items[2][1]
+
+        with pytest.raises(RuntimeError, match="Failed to generate audio"):
+            manager.generate_audio_batch(items)
+
+    async def test_generate_audio_batch_async_creates_files(
+        self, manager: SimpleAssetManager, temp_dir: Path
+    ):
+        """Test that generate_audio_batch_async creates all files in order."""
+        items = [(f"Text {i}", temp_dir / f"audio_{i}.mp3", "ja") for i in range(3)]
 
-    def test_generate_audio_empty_text_raises_error(self, temp_dir: Path):
+        result = await manager.generate_audio_batch_async(items)
+
+        assert result == [path for _, path, _ in items]
+        assert all(path.exists() for path in result)
+
+    def test_generate_audio_empty_text_raises_error(
+        self, manager: SimpleAssetManager, temp_dir: Path
+    ):
         """Test that empty text raises ValueError."""
-        manager = SimpleAssetManager(output_dir=temp_dir)
         audio_path = temp_dir / "test.mp3"
 
         with pytest.raises(ValueError, match="Text cannot be empty"):
             manager.generate_audio("", audio_path)
 
-    def test_hex_to_rgb_conversion(self):
-        """Test hex color to RGB conversion."""
-        from app.services.asset_manager import SimpleAssetManager
-
-        # Test standard hex color
-        rgb = SimpleAssetManager._hex_to_rgb("#FF0000")
-        assert rgb == (255, 0, 0)
-
-        # Test hex without #
-        rgb = SimpleAssetManager._hex_to_rgb("00FF00")
-        assert rgb == (0, 255, 0)
+    @pytest.mark.parametrize(
+        "hex_color, expected",
+        [("#FF0000", (255, 0, 0)), ("00FF00", (0, 255, 0))],
+    )
+    def test_hex_to_rgb_conversion(self, hex_color: str, expected: tuple[int, int, int]):
+        """Test hex color to RGB conversion, with and without the leading '#'."""
+        assert SimpleAssetManager._hex_to_rgb(hex_color) == expected
 
-    def test_hex_to_rgb_invalid_format(self):
+    @pytest.mark.parametrize("hex_color", ["invalid", "#FF"])
+    def test_hex_to_rgb_invalid_format(self, hex_color: str):
         """Test that invalid hex format raises error."""
-        from app.services.asset_manager import SimpleAssetManager
-
-        with pytest.raises(ValueError):
-            SimpleAssetManager._hex_to_rgb("invalid")
-
         with pytest.raises(ValueError):
-            SimpleAssetManager._hex_to_rgb("#FF")
-
+            SimpleAssetManager._hex_to_rgb(hex_color)
@@ -3,9 +3,10 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 
-from app.core.config import Settings
-from app.core.font_manager import FontManager
+from app.core.config import _PLATFORM_FONTS, Settings, _detect_default_font, ensure_directory
+from app.core.font_manager import FontManager, warm_up_fonts
 
 
 class TestSettings:
@@ -22,51 +23,64 @@ class TestSettings:
 
     def test_settings_has_defaults(self):
         """Test that settings have sensible defaults."""
-        settings = Settings()
+        # model_construct applies field defaults only: no env/.env parsing, no font detection
+        settings = Settings.model_construct()
 
         assert settings.output_directory == Path("output")
         assert settings.temp_directory == Path("temp")
 
-    @patch("platform.system")
-    def test_font_detection_macos(self, mock_system, monkeypatch):
+    @pytest.fixture
+    def clear_font_cache(self):
+        """Clear the cached font detection around a test so platform patches take effect."""
+        _detect_default_font.cache_clear()
+        yield
+        _detect_default_font.cache_clear()
+
+    @patch("platform.system", return_value="Darwin")
+    def test_font_detection_macos(self, mock_system, clear_font_cache):
         """Test font detection on macOS."""
-        mock_system.return_value = "Darwin"
+        settings = Settings()
 
-        # Clear cache to force re-creation of Settings
-        Settings.model_config = Settings.model_config
+        assert settings.default_font_path in _PLATFORM_FONTS["Darwin"]
 
+    @patch("platform.system", return_value="Linux")
+    def test_font_detection_linux(self, mock_system, clear_font_cache):
+        """Test font detection on Linux."""
         settings = Settings()
 
-        # Should attempt to find macOS fonts
-        assert settings.default_font_path is not None or settings.default_font_path == ""
+        assert settings.default_font_path in _PLATFORM_FONTS["Linux"]
 
-    @patch("platform.system")
-    def test_font_detection_linux(self, mock_system):
-        """Test font detection on Linux."""
-        mock_system.return_value = "Linux"
+    def test_ensure_directory_recreates_deleted_directory(self, temp_dir: Path):
+        """Test that ensure_directory creates the path again after it is removed."""
+        target = temp_dir / "nested" / "dir"
+
+        assert ensure_directory(target) == target
+        assert target.is_dir()
+
+        target.rmdir()
+
+        assert ensure_directory(target) == target
+        assert target.is_dir()
 
-        settings = Settings()
 
-        # Should attempt to find Linux fonts
-        assert settings.default_font_path is not None or settings.default_font_path == ""
+@pytest.fixture(scope="class")
+def font_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one placeholder font file shared by the class."""
+    font_path = tmp_path_factory.mktemp("fonts") / "custom_font.ttf"
+    font_path.touch()
+    return font_path
 
 
 class TestFontManager:
     """Tests for FontManager class."""
 
-    def test_font_manager_with_custom_path(self, temp_dir: Path):
+    def test_font_manager_with_custom_path(self, font_path: Path):
         """Test FontManager with custom font path."""
-        font_path = temp_dir / "custom_font.ttf"
-        font_path.touch()
-
         manager = FontManager(font_path=str(font_path))
         assert manager.get_font_path() == str(font_path)
 
-    def test_font_manager_validation(self, temp_dir: Path):
+    def test_font_manager_validation(self, font_path: Path):
         """Test font validation."""
-        font_path = temp_dir / "test_font.ttf"
-        font_path.touch()
-
         manager = FontManager(font_path=str(font_path))
         assert manager.validate_font() is True
 
@@ -76,3 +90,32 @@ class TestFontManager:
         assert manager.validate_font() is False
         assert manager.get_font_path() is None
 
+    def test_font_manager_finds_font_installed_later(self, temp_dir: Path):
+        """Test that a missing font is not cached and is found once it exists."""
+        late_font = temp_dir / "late_font.ttf"
+        manager = FontManager(font_path=str(late_font))
+        assert manager.get_font_path() is None
+
+        late_font.touch()
+
+        assert manager.get_font_path() == str(late_font)
+
+    def test_warm_up_fonts_loads_default_font(self):
+        """Test that warm-up loads the default font through FreeType."""
+        with (
+            patch("app.core.font_manager.get_font_path", return_value="/fonts/test.ttf"),
+            patch("app.core.font_manager.load_font") as mock_load_font,
+        ):
+            warm_up_fonts()
+
+        mock_load_font.assert_called_once_with("/fonts/test.ttf", 70)
+
+    def test_warm_up_fonts_without_font(self):
+        """Test that warm-up is a no-op for fonts when none is available."""
+        with (
+            patch("app.core.font_manager.get_font_path", return_value=None),
+            patch("app.core.font_manager.load_font") as mock_load_font,
+        ):
+            warm_up_fonts()
+
+        mock_load_font.assert_not_called()
@@ -0,0 +1,72 @@
+"""Tests for FFmpegVideoComposer."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.models.video_script import Scene, VideoScript
+from app.services.ffmpeg_composer import FFmpegVideoComposer
+
+
+def _probe(composer: FFmpegVideoComposer, path: Path) -> str:
+    """Return ffmpeg's stream description of a media file."""
+    result = subprocess.run([composer.ffmpeg, "-hide_banner", "-i", str(path)], capture_output=True)
+    return result.stderr.decode()
+
+
+class TestFFmpegVideoComposer:
+    """Tests for FFmpegVideoComposer."""
+
+    @pytest.fixture
+    def composer(self) -> FFmpegVideoComposer:
+        """Create a composer for small test videos."""
+        return FFmpegVideoComposer(width=64, height=36, fps=12)
+
+    @pytest.fixture
+    def script(self) -> VideoScript:
+        """Create a two-scene script."""
+        scenes = [
+            Scene(scene_number=n, dialogue=f"Scene {n}", display_text=f"Scene {n}", duration_seconds=0.5)
+            for n in (1, 2)
+        ]
+        return VideoScript(title="Test", scenes=scenes, total_duration_seconds=1.0)
+
+    @pytest.mark.slow
+    def test_compose_joins_scenes(self, composer, script, temp_dir: Path):
+        """Test that all scenes are encoded and joined into one video with audio."""
+        background = np.zeros((36, 64, 3), dtype=np.uint8)
+        output_path = temp_dir / "out.mp4"
+
+        result = composer.compose(script, output_path, {1: background, 2: background}, {})
+
+        assert result == output_path
+        info = _probe(composer, output_path)
+        assert "Video: h264" in info
+        assert "Audio: aac" in info
+        # Only the final video remains: scene segments are temporary
+        assert list(temp_dir.iterdir()) == [output_path]
+
+    def test_compose_missing_background_raises_error(self, composer, script, temp_dir: Path):
+        """Test that a missing background asset fails composition."""
+        with pytest.raises(RuntimeError, match="Background asset not found"):
+            composer.compose(script, temp_dir / "out.mp4", {}, {})
+
+    def test_compose_shares_cores_between_encoders(self, script, temp_dir: Path):
+        """Test that concurrent scene encoders split the CPU instead of each using all cores."""
+        composer = FFmpegVideoComposer(width=64, height=36, fps=12, max_workers=2)
+        background = np.zeros((36, 64, 3), dtype=np.uint8)
+
+        with (
+            patch("app.services.ffmpeg_composer.os.cpu_count", return_value=8),
+            patch("app.services.ffmpeg_composer.run_ffmpeg") as mock_run,
+            patch("app.services.ffmpeg_composer.concat_segments"),
+        ):
+            composer.compose(script, temp_dir / "out.mp4", {1: background, 2: background}, {})
+
+        assert mock_run.call_count == 2
+        for call in mock_run.call_args_list:
+            args = call.args[1]
+            assert args[args.index("-threads") + 1] == "4"
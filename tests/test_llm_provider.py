@@ -1,19 +1,23 @@
 """Tests for LLM provider implementations."""
 
 import json
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, Mock
 
+import pytest
 
-from app.services.llm_provider import MockLLMProvider
+if TYPE_CHECKING:
+    # Imported lazily in tests: app.services pulls in the whole app graph
+    from app.services.llm_provider import MockLLMProvider
 
 
 class TestMockLLMProvider:
     """Tests for MockLLMProvider."""
 
-    def test_generate_script_content_returns_json(self):
+    def test_generate_script_content_returns_json(self, mock_llm: "MockLLMProvider"):
         """Test that generate_script_content returns valid JSON."""
-        provider = MockLLMProvider()
         input_text = "This is a test. It has multiple sentences."
-        result = provider.generate_script_content(input_text)
+        result = mock_llm.generate_script_content(input_text)
 
         # Should be valid JSON
         data = json.loads(result)
@@ -22,11 +26,10 @@ class TestMockLLMProvider:
         assert "scenes" in data
         assert "total_duration_seconds" in data
 
-    def test_generate_script_content_creates_scenes(self):
+    def test_generate_script_content_creates_scenes(self, mock_llm: "MockLLMProvider"):
         """Test that mock provider creates scenes from sentences."""
-        provider = MockLLMProvider()
         input_text = "First sentence. Second sentence. Third sentence."
-        result = provider.generate_script_content(input_text)
+        result = mock_llm.generate_script_content(input_text)
         data = json.loads(result)
 
         assert len(data["scenes"]) > 0
@@ -34,32 +37,86 @@ class TestMockLLMProvider:
         assert all("dialogue" in scene for scene in data["scenes"])
         assert all("duration_seconds" in scene for scene in data["scenes"])
 
-    def test_generate_script_content_with_japanese(self):
+    def test_generate_script_content_with_japanese(self, mock_llm: "MockLLMProvider"):
         """Test mock provider with Japanese text."""
-        provider = MockLLMProvider()
         input_text = "これは最初の文です。これは二番目の文です。"
-        result = provider.generate_script_content(input_text)
+        result = mock_llm.generate_script_content(input_text)
         data = json.loads(result)
 
         assert len(data["scenes"]) > 0
         assert "title" in data
 
-    def test_generate_script_content_limits_scenes(self):
+    def test_generate_script_content_limits_scenes(self, mock_llm: "MockLLMProvider"):
         """Test that mock provider limits to 5 scenes."""
-        provider = MockLLMProvider()
         # Create text with many sentences
         input_text = ". ".join([f"Sentence {i}" for i in range(10)])
-        result = provider.generate_script_content(input_text)
+        result = mock_llm.generate_script_content(input_text)
         data = json.loads(result)
 
         assert len(data["scenes"]) <= 5
 
-    def test_generate_script_content_empty_input(self):
+    def test_generate_script_content_empty_input(self, mock_llm: "MockLLMProvider"):
         """Test mock provider with empty input."""
-        provider = MockLLMProvider()
-        result = provider.generate_script_content("")
+        result = mock_llm.generate_script_content("")
         data = json.loads(result)
 
         assert "title" in data
         assert isinstance(data["scenes"], list)
 
+    def test_generate_script_content_is_cached(self):
+        """Test that identical input returns the cached result."""
+        from app.services.llm_provider import MockLLMProvider
+
+        first = MockLLMProvider().generate_script_content("Cached input. Second.")
+        second = MockLLMProvider().generate_script_content("Cached input. Second.")
+
+        assert first is second
+
+
+class TestOpenAILLMProvider:
+    """Tests for OpenAILLMProvider response caching (API mocked)."""
+
+    @pytest.fixture
+    def make_provider(self, monkeypatch):
+        """Create providers whose LLM chain is mocked."""
+        from app.services.llm_provider import OpenAILLMProvider
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test_key")
+
+        def _make(**kwargs):
+            provider = OpenAILLMProvider(**kwargs)
+            provider.prompt_template = MagicMock()
+            chain = provider.prompt_template.__or__.return_value
+            chain.invoke.return_value = Mock(content='```json\n{"title": "T"}\n```')
+            return provider, chain
+
+        return _make
+
+    def test_caches_when_temperature_is_zero(self, make_provider):
+        """Test that deterministic providers reuse responses."""
+        provider, chain = make_provider(temperature=0)
+
+        assert provider.generate_script_content("Input") == '{"title": "T"}'
+        assert provider.generate_script_content("Input") == '{"title": "T"}'
+        chain.invoke.assert_called_once()
+
+    def test_no_cache_when_sampling(self, make_provider):
+        """Test that sampling providers call the API every time."""
+        provider, chain = make_provider(temperature=0.7)
+
+        provider.generate_script_content("Input")
+        provider.generate_script_content("Input")
+
+        assert chain.invoke.call_count == 2
+
+    def test_get_openai_provider_reuses_instance(self, monkeypatch):
+        """Test that the provider factory returns a shared instance."""
+        from app.services.llm_provider import get_openai_provider
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test_key")
+        get_openai_provider.cache_clear()
+
+        assert get_openai_provider("gpt-4", 0.0) is get_openai_provider("gpt-4", 0.0)
+        assert get_openai_provider("gpt-4", 0.0) is not get_openai_provider("gpt-4", 0.7)
+
+        get_openai_provider.cache_clear()
@@ -5,6 +5,17 @@ from pydantic import ValidationError
 
 from app.models.video_script import Scene, VideoScript
 
+# Validated once; VideoScript reuses Scene instances without revalidating them
+_MULTI_SCENES = tuple(
+    Scene(
+        scene_number=i,
+        dialogue=f"Scene {i}",
+        display_text=f"Scene {i}",
+        duration_seconds=float(i),
+    )
+    for i in range(1, 4)
+)
+
 
 class TestScene:
     """Tests for Scene model."""
@@ -97,20 +108,10 @@ class TestVideoScript:
 
     def test_validate_duration_with_multiple_scenes(self):
         """Test duration validation with multiple scenes."""
-        scenes = [
-            Scene(
-                scene_number=i,
-                dialogue=f"Scene {i}",
-                display_text=f"Scene {i}",
-                duration_seconds=float(i),
-            )
-            for i in range(1, 4)
-        ]
-        total = sum(s.duration_seconds for s in scenes)
         script = VideoScript(
             title="Multi-scene",
-            scenes=scenes,
-            total_duration_seconds=total,
+            scenes=list(_MULTI_SCENES),
+            total_duration_seconds=6.0,
         )
         assert script.validate_duration() is True
 
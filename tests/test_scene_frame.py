@@ -0,0 +1,53 @@
+"""Tests for scene frame rendering."""
+
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from app.core.font_manager import load_font
+from app.services.scene_frame import _layout_subtitle, _wrap_text, render_scene_frame
+
+
+class TestRenderSceneFrame:
+    """Tests for render_scene_frame."""
+
+    def test_renders_subtitle_over_array_background(self):
+        """Test that the subtitle is drawn without modifying the shared background."""
+        background = np.zeros((90, 160, 3), dtype=np.uint8)
+        background.flags.writeable = False
+
+        frame = render_scene_frame(background, "Hello", 160, 90, font_size=20)
+
+        assert frame.size == (160, 90)
+        assert np.asarray(frame).any()
+        assert not background.any()
+
+    def test_resizes_background_file(self, temp_dir: Path):
+        """Test that file backgrounds are loaded and resized to the frame size."""
+        background_path = temp_dir / "bg.png"
+        Image.new("RGB", (32, 18), "#FF0000").save(background_path)
+
+        frame = render_scene_frame(background_path, "", 160, 90)
+
+        assert frame.size == (160, 90)
+        assert frame.getpixel((0, 0)) == (255, 0, 0)
+
+    def test_wrap_text_breaks_long_lines(self):
+        """Test that text is wrapped at spaces, or between characters without spaces."""
+        font = load_font(None, 20)
+
+        assert _wrap_text("one two three four", font, 80).count("\n") >= 1
+        assert "\n" in _wrap_text("あ" * 30, font, 100)
+        assert all(font.getlength(line) <= 100 for line in _wrap_text("あ" * 30, font, 100).splitlines())
+
+    def test_subtitle_layout_is_reused(self):
+        """Test that repeated subtitles reuse the cached layout."""
+        background = np.zeros((90, 160, 3), dtype=np.uint8)
+        _layout_subtitle.cache_clear()
+
+        first = render_scene_frame(background, "Repeated", 160, 90, font_size=20)
+        second = render_scene_frame(background, "Repeated", 160, 90, font_size=20)
+
+        assert _layout_subtitle.cache_info().hits == 1
+        assert first.tobytes() == second.tobytes()
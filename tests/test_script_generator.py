@@ -9,6 +9,47 @@ from app.services.script_generator import ScriptGenerator
 from app.models.video_script import VideoScript
 
 
+class _StubLLM:
+    """Minimal LLM provider returning a fixed payload or raising a fixed error."""
+
+    __slots__ = ("payload", "exc", "calls")
+
+    def __init__(self, payload: str | None = None, exc: Exception | None = None):
+        self.payload = payload
+        self.exc = exc
+        self.calls = 0
+
+    def generate_script_content(self, input_text: str) -> str | None:
+        self.calls += 1
+        if self.exc is not None:
+            raise self.exc
+        return self.payload
+
+
+# Script whose total duration does not match its scenes
+_MISMATCH_JSON = json.dumps(
+    {
+        "title": "Test",
+        "scenes": [
+            {
+                "scene_number": 1,
+                "dialogue": "Test",
+                "display_text": "Test",
+                "duration_seconds": 2.0,
+            },
+            {
+                "scene_number": 2,
+                "dialogue": "Test 2",
+                "display_text": "Test 2",
+                "duration_seconds": 3.0,
+            },
+        ],
+        "total_duration_seconds": 100.0,  # Mismatched
+    }
+)
+
+
+@pytest.mark.xdist_group(name="script")
 class TestScriptGenerator:
     """Tests for ScriptGenerator."""
 
@@ -36,8 +77,8 @@ class TestScriptGenerator:
 
     def test_generate_empty_input_raises_error(self):
         """Test that empty input raises ValueError."""
-        mock_provider = Mock()
-        generator = ScriptGenerator(mock_provider)
+        provider = _StubLLM()
+        generator = ScriptGenerator(provider)
 
         with pytest.raises(ValueError, match="Input text cannot be empty"):
             generator.generate("")
@@ -45,46 +86,43 @@ class TestScriptGenerator:
         with pytest.raises(ValueError, match="Input text cannot be empty"):
             generator.generate("   ")
 
+        # Full-width spaces count as whitespace too
+        with pytest.raises(ValueError, match="Input text cannot be empty"):
+            generator.generate("\n\t\u3000")
+
+        assert provider.calls == 0
+
     def test_generate_invalid_json_raises_error(self):
         """Test that invalid JSON from provider raises ValueError."""
-        mock_provider = Mock()
-        mock_provider.generate_script_content.return_value = "invalid json"
-        generator = ScriptGenerator(mock_provider)
+        generator = ScriptGenerator(_StubLLM(payload="invalid json"))
 
         with pytest.raises(ValueError, match="Failed to parse LLM response"):
             generator.generate("Test input")
 
     def test_generate_missing_fields_raises_error(self):
         """Test that missing required fields raise ValueError."""
-        mock_provider = Mock()
-        mock_provider.generate_script_content.return_value = json.dumps({"title": "Test"})
-        generator = ScriptGenerator(mock_provider)
+        generator = ScriptGenerator(_StubLLM(payload=json.dumps({"title": "Test"})))
 
         with pytest.raises(ValueError, match="missing 'scenes' field"):
             generator.generate("Test input")
 
+    def test_generate_provider_error_raises_error(self):
+        """Test that provider failures are reported as generation failures."""
+        generator = ScriptGenerator(_StubLLM(exc=ConnectionError("API unavailable")))
+
+        with pytest.raises(ValueError, match="Script generation failed: API unavailable"):
+            generator.generate("Test input")
+
+    def test_generate_non_string_result_raises_error(self):
+        """Test that a provider returning no content is reported as a generation failure."""
+        generator = ScriptGenerator(_StubLLM(payload=None))
+
+        with pytest.raises(ValueError, match="Script generation failed"):
+            generator.generate("Test input")
+
     def test_generate_adjusts_duration_if_mismatch(self, mock_llm_provider_response):
         """Test that generator recalculates duration if mismatch."""
-        # Create JSON with mismatched duration
-        script_data = {
-            "title": "Test",
-            "scenes": [
-                {
-                    "scene_number": 1,
-                    "dialogue": "Test",
-                    "display_text": "Test",
-                    "duration_seconds": 2.0,
-                },
-                {
-                    "scene_number": 2,
-                    "dialogue": "Test 2",
-                    "display_text": "Test 2",
-                    "duration_seconds": 3.0,
-                },
-            ],
-            "total_duration_seconds": 100.0,  # Mismatched
-        }
-        mock_provider = mock_llm_provider_response(json.dumps(script_data))
+        mock_provider = mock_llm_provider_response(_MISMATCH_JSON)
         generator = ScriptGenerator(mock_provider)
 
         script = generator.generate("Test")
@@ -93,3 +131,77 @@ class TestScriptGenerator:
         expected_duration = 2.0 + 3.0
         assert script.total_duration_seconds == expected_duration
 
+    def test_generate_applies_scene_defaults(self, mock_llm_provider_response):
+        """Test that omitted scene fields get defaults and numeric strings are accepted."""
+        script_data = {
+            "title": "Test",
+            "scenes": [{"dialogue": "Hello", "duration_seconds": "2.5"}, {"dialogue": "World"}],
+        }
+        generator = ScriptGenerator(mock_llm_provider_response(json.dumps(script_data)))
+
+        script = generator.generate("Test")
+
+        assert [scene.scene_number for scene in script.scenes] == [1, 2]
+        assert script.scenes[0].display_text == "Hello"
+        assert script.scenes[0].duration_seconds == 2.5
+        assert script.scenes[1].duration_seconds == 3.0
+        assert script.scenes[1].background_color == "#000000"
+        assert script.total_duration_seconds == 5.5
+
+    def test_generate_wrong_field_type_raises_error(self, mock_llm_provider_response):
+        """Test that fields of the wrong type raise ValueError."""
+        script_data = {"title": "Test", "scenes": [{"dialogue": ["not", "text"]}]}
+        generator = ScriptGenerator(mock_llm_provider_response(json.dumps(script_data)))
+
+        with pytest.raises(ValueError, match="Script generation failed"):
+            generator.generate("Test")
+
+
+class TestScriptGeneratorCache:
+    """Tests for the ScriptGenerator disk cache."""
+
+    def test_cache_hit_skips_provider(self, mock_llm_json_response, temp_dir):
+        """Test that a cached script is reused without calling the provider."""
+        mock_provider = Mock(model_name="gpt-4")
+        mock_provider.generate_script_content.return_value = mock_llm_json_response
+        generator = ScriptGenerator(mock_provider, cache_enabled=True, cache_dir=temp_dir)
+
+        first = generator.generate("Cached input")
+        second = generator.generate("Cached input")
+
+        assert first == second
+        mock_provider.generate_script_content.assert_called_once()
+        assert len(list(temp_dir.glob("*.json"))) == 1
+
+    def test_cache_keyed_by_model(self, mock_llm_json_response, temp_dir):
+        """Test that different models do not share cached scripts."""
+        providers = [Mock(model_name="gpt-4"), Mock(model_name="gpt-4o")]
+        for provider in providers:
+            provider.generate_script_content.return_value = mock_llm_json_response
+            ScriptGenerator(provider, cache_enabled=True, cache_dir=temp_dir).generate("Input")
+
+        for provider in providers:
+            provider.generate_script_content.assert_called_once()
+
+    def test_invalid_script_not_cached(self, temp_dir):
+        """Test that responses which fail to parse are not cached."""
+        mock_provider = Mock(model_name="gpt-4")
+        mock_provider.generate_script_content.return_value = "not json"
+        generator = ScriptGenerator(mock_provider, cache_enabled=True, cache_dir=temp_dir)
+
+        with pytest.raises(ValueError):
+            generator.generate("Input")
+
+        assert list(temp_dir.iterdir()) == []
+
+    def test_cache_disabled_by_default(self, mock_llm_json_response, temp_dir):
+        """Test that the cache is off unless enabled."""
+        mock_provider = Mock(model_name="gpt-4")
+        mock_provider.generate_script_content.return_value = mock_llm_json_response
+        generator = ScriptGenerator(mock_provider, cache_dir=temp_dir)
+
+        generator.generate("Input")
+        generator.generate("Input")
+
+        assert mock_provider.generate_script_content.call_count == 2
+        assert list(temp_dir.iterdir()) == []
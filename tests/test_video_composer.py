@@ -0,0 +1,73 @@
+"""Tests for MoviePyVideoComposer."""
+
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import imageio_ffmpeg
+import numpy as np
+import pytest
+
+from app.models.video_script import Scene, VideoScript
+
+if TYPE_CHECKING:
+    # Imported lazily in the fixture: app.services pulls in the whole app graph
+    from app.services.video_composer import MoviePyVideoComposer
+
+
+def _probe(path: Path) -> str:
+    """Return ffmpeg's stream description of a media file."""
+    result = subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-hide_banner", "-i", str(path)], capture_output=True
+    )
+    return result.stderr.decode()
+
+
+class TestMoviePyVideoComposer:
+    """Tests for MoviePyVideoComposer."""
+
+    @pytest.fixture
+    def composer(self) -> "MoviePyVideoComposer":
+        """Create a composer for small test videos."""
+        from app.services.video_composer import MoviePyVideoComposer
+
+        return MoviePyVideoComposer(width=64, height=36, max_workers=2)
+
+    @pytest.fixture
+    def script(self) -> VideoScript:
+        """Create a two-scene script."""
+        scenes = [
+            Scene(scene_number=n, dialogue=f"Scene {n}", display_text=f"Scene {n}", duration_seconds=0.5)
+            for n in (1, 2)
+        ]
+        return VideoScript(title="Test", scenes=scenes, total_duration_seconds=1.0)
+
+    @pytest.mark.slow
+    def test_compose_joins_scenes(self, composer, script, temp_dir: Path):
+        """Test that scenes rendered in worker processes are joined into one video."""
+        audio_path = temp_dir / "audio.mp3"
+        subprocess.run(
+            [
+                imageio_ffmpeg.get_ffmpeg_exe(), "-loglevel", "error",
+                "-f", "lavfi", "-i", "sine=frequency=440:duration=0.2",
+                "-ac", "1", str(audio_path),
+            ],
+            check=True,
+        )
+        background = np.zeros((36, 64, 3), dtype=np.uint8)
+        output_path = temp_dir / "out" / "out.mp4"
+
+        # Scene 1 loops its short audio, scene 2 gets silence
+        result = composer.compose(script, output_path, {1: background, 2: background}, {1: audio_path})
+
+        assert result == output_path
+        info = _probe(output_path)
+        assert "Video: h264" in info
+        assert "Audio: aac" in info
+        # Only the final video remains: scene segments are temporary
+        assert list(output_path.parent.iterdir()) == [output_path]
+
+    def test_compose_missing_background_raises_error(self, composer, script, temp_dir: Path):
+        """Test that a missing background asset fails composition."""
+        with pytest.raises(RuntimeError, match="Background asset not found"):
+            composer.compose(script, temp_dir / "out.mp4", {1: np.zeros((36, 64, 3), np.uint8)}, {})
@@ -1,18 +1,26 @@
 """Integration tests for video generation workflow."""
 
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
-from app.services.video_generator import generate_video_from_text
-from app.services.llm_provider import MockLLMProvider
 
+@pytest.fixture(autouse=True)
+def temp_directory(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep per-generation scratch files out of the working directory."""
+    from app.core.config import get_settings
 
+    monkeypatch.setattr(get_settings(), "temp_directory", temp_dir / "temp")
+    return temp_dir / "temp"
+
+
+@pytest.mark.xdist_group(name="video")
 class TestVideoGeneratorIntegration:
     """Integration tests for the full video generation pipeline."""
 
-    @patch("app.services.video_composer.MoviePyVideoComposer.compose")
+    @patch("app.services.ffmpeg_composer.FFmpegVideoComposer.compose")
     @patch("app.services.asset_manager.SimpleAssetManager.generate_audio")
     @patch("app.services.asset_manager.SimpleAssetManager.get_background_image")
     def test_generate_video_from_text_full_workflow(
@@ -23,6 +31,8 @@ class TestVideoGeneratorIntegration:
         temp_dir: Path,
     ):
         """Test the complete video generation workflow."""
+        from app.services.video_generator import generate_video_from_text
+
         # Setup mocks
         mock_bg_path = temp_dir / "bg_1.png"
         mock_bg_path.touch()
@@ -52,12 +62,14 @@ class TestVideoGeneratorIntegration:
 
     def test_generate_video_from_text_with_custom_providers(self, temp_dir: Path):
         """Test video generation with custom provider instances."""
+        from app.services.video_generator import generate_video_from_text
+
         mock_llm = Mock()
         mock_llm.generate_script_content.return_value = '{"title": "Test", "scenes": [{"scene_number": 1, "dialogue": "Test", "display_text": "Test", "duration_seconds": 2.0, "background_color": "#000000"}], "total_duration_seconds": 2.0}'
 
         mock_asset = Mock()
         mock_asset.get_background_image.return_value = temp_dir / "bg.png"
-        mock_asset.generate_audio.return_value = temp_dir / "audio.mp3"
+        mock_asset.generate_audio_batch.return_value = [temp_dir / "audio.mp3"]
         temp_dir.joinpath("bg.png").touch()
         temp_dir.joinpath("audio.mp3").touch()
 
@@ -76,38 +88,112 @@ class TestVideoGeneratorIntegration:
         assert result == output_path
         mock_llm.generate_script_content.assert_called_once()
         mock_asset.get_background_image.assert_called()
+        mock_asset.generate_audio_batch.assert_called_once()
         mock_composer.compose.assert_called_once()
 
-    def test_generate_video_from_text_fallback_to_mock_llm(self, temp_dir: Path):
+    def test_generate_video_batches_audio(self, temp_dir: Path):
+        """Test that all scene audio is requested in one batch, dropping failed scenes."""
+        from app.services.video_generator import generate_video_from_text
+
+        mock_llm = Mock()
+        mock_llm.generate_script_content.return_value = (
+            '{"title": "Test", "total_duration_seconds": 4.0, "scenes": ['
+            '{"scene_number": 1, "dialogue": "First", "duration_seconds": 2.0},'
+            '{"scene_number": 2, "dialogue": "Second", "duration_seconds": 2.0}]}'
+        )
+        mock_asset = Mock()
+        mock_asset.get_background_image.return_value = temp_dir / "bg.png"
+        mock_asset.generate_audio_batch.return_value = [
+            temp_dir / "audio_1.mp3",
+            RuntimeError("TTS unavailable"),
+        ]
+        mock_composer = Mock()
+
+        generate_video_from_text(
+            input_text="Test",
+            output_path=temp_dir / "output.mp4",
+            llm_provider=mock_llm,
+            asset_manager=mock_asset,
+            video_composer=mock_composer,
+        )
+
+        items = mock_asset.generate_audio_batch.call_args.args[0]
+        assert [text for text, _, _ in items] == ["First", "Second"]
+        assert mock_asset.generate_audio_batch.call_args.kwargs["return_exceptions"] is True
+        audio_assets = mock_composer.compose.call_args.kwargs["audio_assets"]
+        assert audio_assets == {1: temp_dir / "audio_1.mp3"}
+
+    def test_concurrent_generations_use_separate_audio_files(
+        self, temp_dir: Path, temp_directory: Path
+    ):
+        """Test that overlapping generations never share audio paths."""
+        from app.services.video_generator import generate_video_from_text
+
+        barrier = threading.Barrier(2, timeout=5)
+        batches: list[list[Path]] = []
+
+        def generate_audio_batch(items, return_exceptions=False):
+            batches.append([path for _, path, _ in items])
+            barrier.wait()  # Only passes if both generations are in flight at once
+            return [path for _, path, _ in items]
+
+        def run(idx: int) -> None:
+            mock_asset = Mock()
+            mock_asset.get_background_image.return_value = temp_dir / "bg.png"
+            mock_asset.generate_audio_batch.side_effect = generate_audio_batch
+            generate_video_from_text(
+                input_text="First. Second.",
+                output_path=temp_dir / f"output_{idx}.mp4",
+                asset_manager=mock_asset,
+                video_composer=Mock(),
+            )
+
+        threads = [threading.Thread(target=run, args=(idx,)) for idx in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(batches) == 2
+        assert not set(batches[0]) & set(batches[1])
+        # Per-generation audio directories are removed once composed
+        assert list(temp_directory.iterdir()) == []
+
+    def test_generate_video_from_text_fallback_to_mock_llm(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test that invalid OpenAI config falls back to MockLLM."""
-        with patch("app.services.video_generator.OpenAILLMProvider") as mock_openai:
-            mock_openai.side_effect = ValueError("No API key")
+        from app.services import video_generator
+        from app.services.video_generator import generate_video_from_text
 
-            with patch("app.services.video_generator.SimpleAssetManager") as mock_asset:
-                with patch("app.services.video_generator.MoviePyVideoComposer") as mock_composer:
-                    mock_bg_path = temp_dir / "bg.png"
-                    mock_bg_path.touch()
-                    mock_audio_path = temp_dir / "audio.mp3"
-                    mock_audio_path.touch()
+        mock_bg_path = temp_dir / "bg.png"
+        mock_bg_path.touch()
+        mock_audio_path = temp_dir / "audio.mp3"
+        mock_audio_path.touch()
+        output_path = temp_dir / "output.mp4"
 
-                    mock_asset_instance = Mock()
-                    mock_asset_instance.get_background_image.return_value = mock_bg_path
-                    mock_asset_instance.generate_audio.return_value = mock_audio_path
-                    mock_asset.return_value = mock_asset_instance
+        mock_asset = Mock()
+        mock_asset.get_background_image.return_value = mock_bg_path
+        mock_asset.generate_audio_batch.return_value = [mock_audio_path]
+        mock_composer = Mock()
+        mock_composer.compose.return_value = output_path
 
-                    mock_composer_instance = Mock()
-                    output_path = temp_dir / "output.mp4"
-                    mock_composer_instance.compose.return_value = output_path
-                    mock_composer.return_value = mock_composer_instance
+        monkeypatch.setattr(
+            video_generator, "get_openai_provider", Mock(side_effect=ValueError("No API key"))
+        )
+        monkeypatch.setattr(video_generator, "SimpleAssetManager", Mock(return_value=mock_asset))
+        monkeypatch.setattr(
+            video_generator, "FFmpegVideoComposer", Mock(return_value=mock_composer)
+        )
 
-                    result = generate_video_from_text(
-                        input_text="Test",
-                        output_path=output_path,
-                        use_mock_llm=False,  # Tries OpenAI, should fallback
-                    )
+        result = generate_video_from_text(
+            input_text="Test",
+            output_path=output_path,
+            use_mock_llm=False,  # Tries OpenAI, should fallback
+        )
 
-                    # Should succeed with fallback
-                    assert result == output_path
+        # Should succeed with fallback
+        assert result == output_path
 
 
 class TestVideoGeneratorErrorHandling:
@@ -115,6 +201,8 @@ class TestVideoGeneratorErrorHandling:
 
     def test_generate_video_empty_input_raises_error(self, temp_dir: Path):
         """Test that empty input raises error."""
+        from app.services.video_generator import generate_video_from_text
+
         output_path = temp_dir / "output.mp4"
 
         with pytest.raises(RuntimeError, match="Script generation failed"):
@@ -124,9 +212,10 @@ class TestVideoGeneratorErrorHandling:
                 use_mock_llm=True,
             )
 
-    def test_generate_video_asset_generation_failure(self, temp_dir: Path):
+    def test_generate_video_asset_generation_failure(self, temp_dir: Path, mock_llm):
         """Test handling of asset generation failures."""
-        mock_llm = MockLLMProvider()
+        from app.services.video_generator import generate_video_from_text
+
         mock_asset = Mock()
         mock_asset.get_background_image.side_effect = RuntimeError("Asset generation failed")
 